@@ -0,0 +1,45 @@
+"""
+Compares eager and lazy evaluation on a graph of 10k derived Values of which only 1% are observed.
+
+Run from the repository root with ``python -m benchmarks.lazy_evaluation``.
+"""
+import time
+
+from pyquantum.value import Value, Observer
+
+NODES = 10_000
+OBSERVED = NODES // 100
+UPDATES = 100
+
+
+def expensive(x):
+    return sum(range(x % 7 + 50))
+
+
+def build(lazy: bool):
+    source = Value(0)
+    nodes = [source.map(lambda x, i=i: expensive(x + i), lazy=lazy) for i in range(NODES)]
+    observers = [Observer([node]) for node in nodes[::NODES // OBSERVED]]
+    for observer in observers:
+        observer.on_update(lambda data: None)
+    return source, nodes, observers
+
+
+def run(lazy: bool) -> float:
+    source, nodes, observers = build(lazy)
+    start = time.perf_counter()
+    for i in range(1, UPDATES + 1):
+        source.set_data(i)
+    return time.perf_counter() - start
+
+
+def main():
+    eager = run(lazy=False)
+    lazy = run(lazy=True)
+    print(f"{NODES} nodes, {OBSERVED} observed, {UPDATES} updates")
+    print(f"eager: {eager * 1000:8.1f} ms")
+    print(f"lazy:  {lazy * 1000:8.1f} ms  ({eager / lazy:.1f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
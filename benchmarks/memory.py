@@ -0,0 +1,47 @@
+"""
+Reports the memory used per node of the Value graph for leaves, derived Values and widget Observers.
+
+Run from the repository root with ``python -m benchmarks.memory``.
+"""
+import gc
+import tracemalloc
+
+from pyquantum.value import Value, Observer
+
+NODES = 200_000
+
+
+def measure(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return (after - before) / NODES
+
+
+def leaves():
+    return [Value(i) for i in range(NODES)]
+
+
+def derived():
+    source = Value(0)
+    return source, [source + i for i in range(NODES)]
+
+
+def observers():
+    values = [Value(i) for i in range(NODES)]
+    return values, [Observer([value]) for value in values]
+
+
+def main():
+    print(f"{NODES} nodes")
+    print(f"leaf Value:        {measure(leaves):7.1f} bytes/node")
+    print(f"derived Value:     {measure(derived):7.1f} bytes/node")
+    print(f"Value + Observer:  {measure(observers):7.1f} bytes/node")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,387 @@
+"""
+Headless benchmark suite for the reactive core and the widget layer.
+
+Every benchmark is run ``--repeat`` times; the minimum and median wall time are written as JSON and compared with a
+stored baseline. Run from the repository root with ``python -m benchmarks.suite``; uses the offscreen Qt platform
+by default.
+
+    python -m benchmarks.suite                          # run and compare with benchmarks/baseline.json
+    python -m benchmarks.suite -k value --repeat 10     # only benchmarks whose name contains 'value'
+    python -m benchmarks.suite --output results.json    # also write the results
+    python -m benchmarks.suite --save-baseline          # replace the baseline with this run
+
+The exit status is 1 if a benchmark is slower than its baseline by more than ``--tolerance``.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt6.QtCore import QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem, QTableView
+
+from pyquantum.array import SeriesValue
+from pyquantum.collection import ValueList
+from pyquantum.table import ColumnarTableModel, TableColumn
+from pyquantum.sparkline import Sparkline
+from pyquantum.ui import Label, Button, Input, Row, Column, TabView, Widget, ViewModel, UpdateScheduler, ListView
+from pyquantum.value import Value, Observer, computed
+
+BASELINE = Path(__file__).with_name('baseline.json')
+UPDATES = 100
+
+# name -> function running one measurement and returning the elapsed seconds
+benchmarks = {}
+
+
+def benchmark(function):
+    benchmarks[function.__name__] = function
+    return function
+
+
+def _timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def _update(source: Value, updates: int = UPDATES):
+    for i in range(1, updates + 1):
+        source.set_data(i)
+
+
+def _observe(value: Value) -> Observer:
+    observer = Observer([value])
+    observer.on_update(lambda data: None)
+    return observer
+
+
+@benchmark
+def value_chain() -> float:
+    """100 updates through a chain of 1000 derived Values."""
+    source = Value(0)
+    node = source
+    for _ in range(1000):
+        node = node + 1
+    observer = _observe(node)
+    return _timed(_update, source)
+
+
+@benchmark
+def value_fanout() -> float:
+    """10 updates of a Value with 10k observed subscribers."""
+    source = Value(0)
+    nodes = [source + i for i in range(10_000)]
+    observers = [_observe(node) for node in nodes]
+    return _timed(_update, source, 10)
+
+
+@benchmark
+def value_diamond() -> float:
+    """100 updates through 250 stacked diamonds (every node is recomputed once per update)."""
+    source = Value(0)
+    node = source
+    for _ in range(250):
+        node = (node + 1) + (node - 1)
+        node = node / 2
+    observer = _observe(node)
+    return _timed(_update, source)
+
+
+def _expressions(build) -> float:
+    a, b, c, d = Value(1), Value(2), Value(3), Value(0)
+    nodes = [build(a, b, c, d, i) for i in range(1000)]
+    observers = [_observe(node) for node in nodes]
+    return _timed(_update, a)
+
+
+@benchmark
+def expression_operators() -> float:
+    """100 updates of 1000 observed ``(a + b) * c > d + i`` expressions built from operators."""
+    return _expressions(lambda a, b, c, d, i: (a + b) * c > d + i)
+
+
+@benchmark
+def expression_computed() -> float:
+    """100 updates of 1000 observed ``(a + b) * c > d + i`` expressions, one computed() node each."""
+    return _expressions(lambda a, b, c, d, i: computed(lambda: (a.data + b.data) * c.data > d.data + i))
+
+
+def _view_model(size: int) -> ViewModel:
+    model = ViewModel()
+    for i in range(size):
+        setattr(model, f"field{i}", 0)
+    return model
+
+
+@benchmark
+def viewmodel_assign() -> float:
+    """Assigns 10 rounds of 1000 observed ViewModel attributes."""
+    model = _view_model(1000)
+    observers = [_observe(value) for value in model.__dict__.values()]
+
+    def assign():
+        for i in range(1, 11):
+            for name in model.__dict__:
+                setattr(model, name, i)
+
+    return _timed(assign)
+
+
+@benchmark
+def viewmodel_transaction() -> float:
+    """Assigns 10 rounds of 1000 observed ViewModel attributes, one transaction per round."""
+    model = _view_model(1000)
+    observers = [_observe(value) for value in model.__dict__.values()]
+
+    def assign():
+        for i in range(1, 11):
+            with model.transaction():
+                for name in model.__dict__:
+                    setattr(model, name, i)
+
+    return _timed(assign)
+
+
+def _widgets(rows: int) -> Widget:
+    text = Value('text')
+    enabled = Value(True)
+    return Widget(None, Column([
+        Row([Label(None, text), Button(None, 'button', enabled=enabled), Input(None, text)]) for _ in range(rows)
+    ]))
+
+
+@benchmark
+def widgets_construct() -> float:
+    """Constructs 10k bound Label/Button/Input widgets inside Rows of a Column."""
+    start = time.perf_counter()
+    widget = _widgets(3334)
+    elapsed = time.perf_counter() - start
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def widgets_update() -> float:
+    """Updates the Values bound to 2000 widgets 10 times, flushing the coalesced updates every time."""
+    text = Value('text')
+    widget = Widget(None, Column([Row([Label(None, text), Input(None, text)]) for _ in range(1000)]))
+    scheduler = UpdateScheduler.default()
+
+    def update():
+        for i in range(10):
+            text.set_data(str(i))
+            scheduler.flush()
+
+    elapsed = _timed(update)
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def tabview_startup() -> float:
+    """Builds and shows a TabView with 15 tabs of 100 widget rows each."""
+    start = time.perf_counter()
+    tabs = TabView(None, {f"tab {i}": _widgets(100) for i in range(15)})
+    tabs.show()
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    tabs.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def tabview_lazy_startup() -> float:
+    """Builds and shows a TabView with 15 tabs of 100 widget rows each, built on first activation."""
+    start = time.perf_counter()
+    tabs = TabView(None, {f"tab {i}": lambda: _widgets(100) for i in range(15)}, suspend_hidden=True)
+    tabs.show()
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    tabs.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def listview_scroll() -> float:
+    """Shows 100k items in a ListView and scrolls through them in 500 steps."""
+    items = ValueList(f"entry {i}" for i in range(100_000))
+    start = time.perf_counter()
+    view = ListView(None, items, lambda item: Label(None, item, coalesce=False))
+    view.resize(400, 800)
+    view.show()
+    QApplication.processEvents()
+    scrollbar = view.verticalScrollBar()
+    for step in range(500):
+        scrollbar.setValue(step * (scrollbar.maximum() // 500))
+        view.viewport().repaint()
+    elapsed = time.perf_counter() - start
+    view.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+def _keyed_column(size: int):
+    items = ValueList(range(size))
+    widget = Widget(None, Column().bind(items, lambda item: Label(None, item.map(str)), key=lambda item: item))
+    return items, widget
+
+
+@benchmark
+def foreach_append() -> float:
+    """Appends 10 blocks of 100 items to a keyed Column of 5k Labels."""
+    items, widget = _keyed_column(5000)
+    start = time.perf_counter()
+    for block in range(10):
+        items.extend(range(5000 + block * 100, 5000 + (block + 1) * 100))
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def foreach_reorder() -> float:
+    """Moves a block of 50 items to the front of a keyed Column of 5k Labels 10 times, then reverses it."""
+    items, widget = _keyed_column(5000)
+    start = time.perf_counter()
+    for _ in range(10):
+        items.move(2500, 2550, 0)
+    items.set_data(reversed(items.data))
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def sparkline_stream() -> float:
+    """Streams 1000 blocks of 100 samples into a full 1M-sample series shown by a Sparkline, repainting each time."""
+    series = SeriesValue(1_000_000)
+    series.extend(np.sin(np.arange(1_000_000) / 1000))
+    sparkline = Sparkline(None, series, coalesce=False)
+    sparkline.resize(800, 100)
+    sparkline.show()
+    QApplication.processEvents()
+    block = np.linspace(-1, 1, 100)
+    start = time.perf_counter()
+    for _ in range(1000):
+        series.extend(block)
+        sparkline.repaint()
+    elapsed = time.perf_counter() - start
+    sparkline.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+@benchmark
+def delegate_edit() -> float:
+    """Runs 300 create/set/commit/destroy editor cycles over float, int and category delegates."""
+    model = ColumnarTableModel([
+        TableColumn('float', 'float', np.linspace(1, 2, 100)),
+        TableColumn('int', 'int', np.arange(1, 101)),
+        TableColumn('category', 'category', np.arange(100) % 3, items=['a', 'b', 'c']),
+    ])
+    view = QTableView()
+    view.setModel(model)
+    model.install_delegates(view)
+    option = QStyleOptionViewItem()
+
+    def edit():
+        for i in range(100):
+            for column in range(3):
+                index = model.index(i, column)
+                delegate = view.itemDelegateForColumn(column)
+                editor = delegate.createEditor(view.viewport(), option, index)
+                delegate.setEditorData(editor, index)
+                delegate.setModelData(editor, model, index)
+                delegate.destroyEditor(editor, index)
+
+    elapsed = _timed(edit)
+    view.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+def run(names: list, repeat: int) -> dict:
+    results = {}
+    for name in names:
+        times = []
+        for _ in range(repeat):
+            gc.collect()
+            times.append(benchmarks[name]())
+        results[name] = {'min': min(times), 'median': statistics.median(times), 'repeat': repeat}
+        print(f"{name:24} {min(times) * 1e3:10.2f} ms min {statistics.median(times) * 1e3:10.2f} ms median")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Prints the change of every benchmark against ``baseline`` and returns the names of the regressions."""
+    regressions = []
+    print(f"\n{'benchmark':24} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:24} {'-':>10} {result['min'] * 1e3:10.2f}")
+            continue
+        ratio = result['min'] / baseline[name]['min']
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:24} {baseline[name]['min'] * 1e3:10.2f} {result['min'] * 1e3:10.2f} {(ratio - 1) * 100:+7.1f}%"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-k', dest='filter', default='', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path, help="write the results to this JSON file")
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    names = [name for name in benchmarks if args.filter in name]
+    report = {
+        'machine': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'qt': QT_VERSION_STR,
+        },
+        'results': run(names, args.repeat),
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        if args.baseline.exists():
+            # Keep the baseline of benchmarks that were not run
+            report['results'] = {**json.loads(args.baseline.read_text())['results'], **report['results']}
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        return
+    if args.baseline.exists():
+        regressions = compare(report['results'], json.loads(args.baseline.read_text())['results'], args.tolerance)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
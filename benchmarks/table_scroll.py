@@ -0,0 +1,67 @@
+"""
+Scrolls a 1M x 20 ColumnarTableModel through a QTableView and reports the time per repaint.
+
+Run from the repository root with ``python -m benchmarks.table_scroll``; uses the offscreen Qt platform by default.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from pyquantum.table import ColumnarTableModel, TableColumn
+
+ROWS = 1_000_000
+COLUMNS = 20
+STEPS = 200
+
+
+def build_model() -> ColumnarTableModel:
+    rng = np.random.default_rng(0)
+    columns = []
+    for i in range(COLUMNS):
+        if i % 4 == 0:
+            columns.append(TableColumn(f"int {i}", 'int', rng.integers(0, 1000, ROWS)))
+        elif i % 4 == 1:
+            columns.append(TableColumn(f"category {i}", 'category', rng.integers(0, 3, ROWS), items=['a', 'b', 'c']))
+        else:
+            columns.append(TableColumn(f"float {i}", 'float', rng.random(ROWS)))
+    return ColumnarTableModel(columns)
+
+
+def main():
+    app = QApplication(sys.argv)
+    start = time.perf_counter()
+    model = build_model()
+    view = QTableView()
+    view.setModel(model)
+    model.install_delegates(view)
+    view.resize(1600, 900)
+    view.show()
+    app.processEvents()
+    setup = time.perf_counter() - start
+
+    scrollbar = view.verticalScrollBar()
+    start = time.perf_counter()
+    for step in range(STEPS):
+        scrollbar.setValue(step * (scrollbar.maximum() // STEPS))
+        view.viewport().repaint()
+    scroll = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with model.batch():
+        for column in range(0, COLUMNS, 2):
+            model.update(column, 0, model.columns[column].values[:10_000])
+    update = time.perf_counter() - start
+
+    print(f"{ROWS} x {COLUMNS} table")
+    print(f"setup:         {setup * 1000:8.1f} ms")
+    print(f"scroll repaint:{scroll / STEPS * 1000:8.2f} ms/frame ({STEPS} frames)")
+    print(f"batched update:{update * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
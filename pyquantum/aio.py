@@ -0,0 +1,128 @@
+import asyncio
+import math
+import selectors
+from typing import Coroutine, Optional
+
+from PyQt6.QtCore import Qt, QCoreApplication, QEventLoop, QSocketNotifier, QTimer
+
+
+class QtSelector(selectors.BaseSelector):
+    """
+    Selector that waits inside a Qt event loop instead of the operating system's poll, so that asyncio and Qt share
+    one thread: while asyncio has nothing to do, Qt processes its events until a registered file descriptor becomes
+    ready, the asyncio timeout expires or the loop is woken up.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._notifiers = {}
+        self._event_loop = None
+        self._timer = None
+        self._blocking = False
+
+    def register(self, fileobj, events, data=None):
+        key = self._selector.register(fileobj, events, data)
+        notifiers = []
+        if events & selectors.EVENT_READ:
+            notifiers.append(QSocketNotifier(key.fd, QSocketNotifier.Type.Read))
+        if events & selectors.EVENT_WRITE:
+            notifiers.append(QSocketNotifier(key.fd, QSocketNotifier.Type.Write))
+        for notifier in notifiers:
+            notifier.setEnabled(False)
+            notifier.activated.connect(self._ready)
+        self._notifiers[key.fd] = notifiers
+        return key
+
+    def unregister(self, fileobj):
+        key = self._selector.unregister(fileobj)
+        for notifier in self._notifiers.pop(key.fd, ()):
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        return key
+
+    def get_map(self):
+        return self._selector.get_map()
+
+    def close(self):
+        for fd in list(self._notifiers):
+            for notifier in self._notifiers.pop(fd):
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+        self._selector.close()
+
+    def select(self, timeout=None):
+        ready = self._selector.select(0)
+        if ready or (timeout is not None and timeout <= 0):
+            # asyncio is busy, keep the GUI responsive in between its callbacks
+            QCoreApplication.processEvents()
+            return ready or self._selector.select(0)
+
+        if self._event_loop is None:
+            self._event_loop = QEventLoop()
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._event_loop.quit)
+
+        for notifiers in self._notifiers.values():
+            for notifier in notifiers:
+                notifier.setEnabled(True)
+        if timeout is not None:
+            self._timer.start(math.ceil(timeout * 1000))
+        self._blocking = True
+        try:
+            self._event_loop.exec()
+        finally:
+            self._blocking = False
+            self._timer.stop()
+            for notifiers in self._notifiers.values():
+                for notifier in notifiers:
+                    notifier.setEnabled(False)
+        return self._selector.select(0)
+
+    def wakeup(self):
+        if self._blocking:
+            self._event_loop.quit()
+
+    def _ready(self, *args):
+        self.wakeup()
+
+
+class QtEventLoop(asyncio.SelectorEventLoop):
+    """
+    asyncio event loop running on the Qt event loop of the current thread. Callbacks scheduled from Qt slots (e.g.
+    a resolved ``Value.changed()`` future) wake the loop up immediately, no polling is involved.
+    """
+
+    def __init__(self):
+        self._qt_selector = QtSelector()
+        super(QtEventLoop, self).__init__(self._qt_selector)
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super(QtEventLoop, self).call_soon(callback, *args, context=context)
+        self._qt_selector.wakeup()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super(QtEventLoop, self).call_at(when, callback, *args, context=context)
+        self._qt_selector.wakeup()
+        return handle
+
+
+def run(main: Optional[Coroutine] = None, app: Optional[QCoreApplication] = None):
+    """
+    Runs ``main`` to completion, or the application until its last window is closed, on a ``QtEventLoop``.
+    Use this in place of ``app.exec()``.
+    """
+    app = app or QCoreApplication.instance()
+    loop = QtEventLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        if main is not None:
+            return loop.run_until_complete(main)
+        if hasattr(app, 'lastWindowClosed'):
+            app.lastWindowClosed.connect(loop.stop)
+        loop.run_forever()
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
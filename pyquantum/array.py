@@ -0,0 +1,270 @@
+import operator
+
+import numpy as np
+
+from .value import Value, _foreign_thread, _rsub, _rtruediv, _invert
+
+# Operators of Value mapped to the ufunc computing them elementwise, and whether the arguments are swapped
+_ufuncs = {
+    operator.add: (np.add, False),
+    operator.sub: (np.subtract, False),
+    _rsub: (np.subtract, True),
+    operator.mul: (np.multiply, False),
+    operator.truediv: (np.true_divide, False),
+    _rtruediv: (np.true_divide, True),
+    operator.and_: (np.bitwise_and, False),
+    operator.or_: (np.bitwise_or, False),
+    operator.lt: (np.less, False),
+    operator.le: (np.less_equal, False),
+    operator.gt: (np.greater, False),
+    operator.ge: (np.greater_equal, False),
+    operator.eq: (np.equal, False),
+    operator.neg: (np.negative, False),
+    _invert: (np.invert, False),
+}
+
+# Key of ArrayValues that are not a view on another ArrayValue
+_NO_KEY = object()
+
+
+def _same_data(a, b) -> bool:
+    """Change detection of plain Values derived from ArrayValues: arrays always changed, scalars compare equal."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return False
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def _span(key, length: int):
+    """Rows along the first axis touched by ``key``, or None if unknown."""
+    if isinstance(key, tuple):
+        key = key[0] if key else slice(None)
+    if isinstance(key, (int, np.integer)):
+        index = key + length if key < 0 else key
+        return index, index + 1
+    if isinstance(key, slice):
+        start, stop, step = key.indices(length)
+        if step < 0:
+            start, stop = stop + 1, start + 1
+        return start, max(start, stop)
+    return None
+
+
+def _overlaps(region, key, data: np.ndarray) -> bool:
+    if data.ndim == 0:
+        return True
+    a, b = _span(region, len(data)), _span(key, len(data))
+    return a is None or b is None or (a[0] < b[1] and b[0] < a[1])
+
+
+class ArrayValue(Value):
+    """
+    Value holding a NumPy array that is updated in place.
+
+    Elementwise operators and ufuncs passed to ``map`` derive ArrayValues that recompute into a preallocated buffer
+    (``out=``), so steady-state updates allocate no arrays. Indexing derives a view that is only notified when a
+    ``write`` touches its rows, and ``sum``, ``mean``, ``min`` and ``max`` derive scalar Values. Since data is
+    written in place, a failing ``Value.batch()`` does not roll back array contents.
+    """
+    __slots__ = ('_region', '_key')
+
+    def __init__(self, data, _children=()):
+        super(ArrayValue, self).__init__(np.asarray(data), compare='version', _children=_children)
+        # Region along the first axis touched by the last write, None for the whole array
+        self._region = None
+        self._key = _NO_KEY
+
+    def set_data(self, data):
+        """Copies ``data`` into the current buffer if it fits, otherwise replaces the buffer."""
+        if _foreign_thread():
+            return super(ArrayValue, self).set_data(data)
+        if data is not self._data:
+            data = np.asarray(data)
+            if data.shape == self._data.shape and np.can_cast(data.dtype, self._data.dtype, 'same_kind'):
+                np.copyto(self._data, data)
+            else:
+                self._data = data
+        self._region = None
+        self.touch()
+
+    def write(self, key, values):
+        """Writes ``values`` into ``data[key]``, notifying only views overlapping ``key``."""
+        if _foreign_thread():
+            from .value import _dispatcher
+            _dispatcher.call(self.write, key, values)
+            return
+        self._data[key] = values
+        from .value import _state
+        self._region = None if _state.journals else key
+        self.touch()
+
+    def __getitem__(self, key) -> 'ArrayValue':
+        out = ArrayValue(self._data[key], _children=(self,))
+        out._key = key
+        return out
+
+    def map(self, function, lazy: bool = None, compare=None, memoize: int = None, key=None) -> Value:
+        if function in _ufuncs:
+            function, _ = _ufuncs[function]
+        if isinstance(function, np.ufunc) and function.nin == 1 and memoize is None:
+            return self._elementwise(function, (self,))
+        return super(ArrayValue, self).map(function, lazy, compare, memoize, key)
+
+    def __generic_operation__(self, other, function) -> Value:
+        if function in _ufuncs:
+            ufunc, swapped = _ufuncs[function]
+            return self._elementwise(ufunc, (other, self) if swapped else (self, other))
+        return super(ArrayValue, self).__generic_operation__(other, function)
+
+    # Python prefers the reflected operators of a subclass, so a plain Value on the left derives an ArrayValue too
+    def __radd__(self, other) -> Value:
+        return self.__generic_operation__(other, operator.add)
+
+    def __rsub__(self, other) -> Value:
+        return self.__generic_operation__(other, _rsub)
+
+    def __rmul__(self, other) -> Value:
+        return self.__generic_operation__(other, operator.mul)
+
+    def __rtruediv__(self, other) -> Value:
+        return self.__generic_operation__(other, _rtruediv)
+
+    def __rand__(self, other) -> Value:
+        return self.__generic_operation__(other, operator.and_)
+
+    def __ror__(self, other) -> Value:
+        return self.__generic_operation__(other, operator.or_)
+
+    def _derive(self, function, args, lazy=None, compare=None) -> Value:
+        # Other functions derive plain Values, which must not compare arrays with !=
+        return super(ArrayValue, self)._derive(function, args, lazy, _same_data if compare is None else compare)
+
+    def sum(self) -> Value:
+        return self._derive(np.sum, (self,))
+
+    def mean(self) -> Value:
+        return self._derive(np.mean, (self,))
+
+    def min(self) -> Value:
+        return self._derive(np.min, (self,))
+
+    def max(self) -> Value:
+        return self._derive(np.max, (self,))
+
+    def _elementwise(self, ufunc: np.ufunc, args: tuple) -> 'ArrayValue':
+        out = ArrayValue(ufunc(*[arg.data if isinstance(arg, Value) else arg for arg in args]), _children=args)
+        out._function = ufunc
+        return out
+
+    def _update(self, publisher):
+        if self._key is not _NO_KEY:
+            source = self._args[0]
+            if source._region is not None and not _overlaps(source._region, self._key, source._data):
+                return
+            if not np.may_share_memory(self._data, source._data):
+                self._data = source._data[self._key]
+            self._region = None
+            self.touch()
+        elif self._function is not None:
+            values = [arg.data if isinstance(arg, Value) else arg for arg in self._args]
+            try:
+                self._function(*values, out=self._data)
+            except (TypeError, ValueError):
+                # The inputs changed shape or type, the buffer has to be replaced
+                self._data = self._function(*values)
+            arrays = [arg for arg in self._args if isinstance(arg, ArrayValue)]
+            # Elementwise results change where their only array input changed
+            single = arrays == [publisher] and self._data.shape == publisher._data.shape
+            self._region = publisher._region if single else None
+            self.touch()
+        if self.update_callbacks:
+            self.value_update(publisher.data)
+
+
+class SeriesValue(Value):
+    """
+    Fixed-capacity time series backed by a NumPy ring buffer. ``append`` and ``extend`` are O(1) per sample and
+    ``window(n)`` returns the last ``n`` samples as a read-only view without copying: every sample is written twice,
+    ``capacity`` apart, so the latest ``capacity`` samples are always contiguous. ``data`` is ``window()``; ``total``
+    counts all samples ever appended, which tells observers how many samples are new, and ``resets`` how often the
+    series was replaced with ``set_data``.
+    """
+    __slots__ = ('capacity', 'count', 'total', 'resets', '_buffer', '_position')
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        super(SeriesValue, self).__init__(compare='version')
+        self.capacity = capacity
+        self.count = 0
+        self.total = 0
+        self.resets = 0
+        self._buffer = np.zeros(2 * capacity, dtype=dtype)
+        # Index of the next write into the first half of the buffer
+        self._position = 0
+
+    @property
+    def data(self) -> np.ndarray:
+        Value.data.fget(self)
+        return self.window()
+
+    @data.setter
+    def data(self, data):
+        data = np.array(data, dtype=self._buffer.dtype).ravel()
+        self.count = self._position = 0
+        self.resets += 1
+        self._write(data)
+
+    def set_data(self, data):
+        """Replaces the whole series with ``data``."""
+        if _foreign_thread():
+            return super(SeriesValue, self).set_data(data)
+        self.data = data
+        self.touch()
+
+    def window(self, n: int = None) -> np.ndarray:
+        n = self.count if n is None else min(n, self.count)
+        end = self._position + self.capacity
+        view = self._buffer[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def append(self, sample):
+        if _foreign_thread():
+            from .value import _dispatcher
+            _dispatcher.call(self.append, sample)
+            return
+        position = self._position
+        self._buffer[position] = self._buffer[position + self.capacity] = sample
+        self._position = (position + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.total += 1
+        self.touch()
+
+    def extend(self, samples):
+        if _foreign_thread():
+            from .value import _dispatcher
+            _dispatcher.call(self.extend, samples)
+            return
+        samples = np.asarray(samples, dtype=self._buffer.dtype).ravel()
+        if len(samples):
+            self._write(samples)
+            self.touch()
+
+    def clear(self):
+        self.set_data([])
+
+    def _write(self, samples: np.ndarray):
+        self.total += len(samples)
+        capacity = self.capacity
+        samples = samples[-capacity:]
+        position, size = self._position, len(samples)
+        # Up to two chunks, wrapping around the end of each half
+        first = min(size, capacity - position)
+        for start in (0, capacity):
+            self._buffer[start + position:start + position + first] = samples[:first]
+            self._buffer[start:start + size - first] = samples[first:]
+        self._position = (position + size) % capacity
+        self.count = min(self.count + size, capacity)
@@ -0,0 +1,533 @@
+import weakref
+from bisect import bisect_left, insort
+from collections import namedtuple
+from functools import partial, wraps
+from itertools import count
+from typing import Callable, Iterable, Any, Optional
+
+from .value import Value, _foreign_thread
+
+ListChange = namedtuple('ListChange', ['kind', 'start', 'stop', 'items', 'target'])
+ListChange.__doc__ = """
+Range-level change of a ValueList. ``kind`` is one of
+
+- ``'insert'``: ``items`` were inserted at ``start`` (``stop == start + len(items)``)
+- ``'remove'``: ``items`` in ``[start, stop)`` were removed
+- ``'update'``: the items in ``[start, stop)`` were replaced by ``items``
+- ``'move'``: the items in ``[start, stop)`` were moved, ``target`` is their new start index
+- ``'reset'``: the whole list was replaced by ``items``
+"""
+
+DictChange = namedtuple('DictChange', ['kind', 'key', 'value', 'previous'])
+DictChange.__doc__ = """
+Change of a ValueDict. ``kind`` is ``'set'`` (``previous`` is ``None`` for new keys), ``'delete'`` or ``'reset'``
+(``value`` holds the new contents).
+"""
+
+
+def _in_gui_thread(method):
+    """Hands calls made outside of the GUI thread to the dispatcher, which applies them there (see set_dispatcher)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _foreign_thread():
+            from .value import _dispatcher
+            _dispatcher.call(partial(method, self, *args, **kwargs))
+            return
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ValueList:
+    """
+    Observable list emitting range-level ListChange events. ``map``, ``filter`` and ``sort`` derive read-only lists
+    that are updated from these events, i.e. only the changed items are mapped, tested or re-sorted. Mutations made
+    on worker threads are applied on the GUI thread through the dispatcher, see ``set_dispatcher``.
+    """
+
+    def __init__(self, items: Iterable = ()):
+        self._items = list(items)
+        self._change_callbacks = []
+        self._derived = []
+        self.version = Value(0)
+
+    @property
+    def data(self) -> list:
+        return self._items
+
+    def on_change(self, callback: Callable[[ListChange], None]):
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable[[ListChange], None]):
+        # Rebinding keeps a running emit iterating over the previous list
+        self._change_callbacks = [other for other in self._change_callbacks if other is not callback]
+
+    def derive(self, function: Callable[[list], Any]) -> Value:
+        """Derives a scalar Value holding ``function(items)``, e.g. ``items.derive(len)``."""
+        return self.version.map(lambda _: function(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __repr__(self):
+        return f"ValueList({self._items})"
+
+    @_in_gui_thread
+    def append(self, item):
+        self._insert(len(self._items), [item])
+
+    @_in_gui_thread
+    def extend(self, items: Iterable):
+        self._insert(len(self._items), list(items))
+
+    @_in_gui_thread
+    def insert(self, index: int, item):
+        self._insert(self._normalize(index, insert=True), [item])
+
+    def pop(self, index: int = -1):
+        index = self._normalize(index)
+        item = self._items[index]
+        del self[index]
+        return item
+
+    @_in_gui_thread
+    def remove(self, item):
+        index = self._items.index(item)
+        self._remove(index, index + 1)
+
+    def clear(self):
+        self.set_data([])
+
+    @_in_gui_thread
+    def move(self, start: int, stop: int, target: int):
+        """Moves the items in ``[start, stop)`` so that they start at index ``target`` afterwards."""
+        if target != start and stop > start:
+            self._move(start, stop, target)
+
+    @_in_gui_thread
+    def set_data(self, items: Iterable):
+        self._reset(list(items))
+
+    @_in_gui_thread
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step != 1:
+                raise ValueError("Only contiguous slices can be assigned")
+            items = list(item)
+            if len(items) == stop - start:
+                self._update(start, items)
+            else:
+                self._remove(start, stop)
+                self._insert(start, items)
+        else:
+            index = self._normalize(index)
+            self._update(index, [item])
+
+    @_in_gui_thread
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step != 1:
+                raise ValueError("Only contiguous slices can be deleted")
+            self._remove(start, stop)
+        else:
+            index = self._normalize(index)
+            self._remove(index, index + 1)
+
+    def map(self, function: Callable[[Any], Any]) -> 'ValueList':
+        return MappedList(self, function)
+
+    def filter(self, predicate: Callable[[Any], bool]) -> 'ValueList':
+        return FilteredList(self, predicate)
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> 'ValueList':
+        return SortedList(self, key, reverse)
+
+    def _normalize(self, index: int, insert: bool = False) -> int:
+        size = len(self._items)
+        if index < 0:
+            index += size
+        if insert:
+            return min(max(index, 0), size)
+        if not 0 <= index < size:
+            raise IndexError("ValueList index out of range")
+        return index
+
+    def _insert(self, start: int, items: list):
+        if items:
+            self._items[start:start] = items
+            self._emit(ListChange('insert', start, start + len(items), items, None))
+
+    def _remove(self, start: int, stop: int):
+        if stop > start:
+            items = self._items[start:stop]
+            del self._items[start:stop]
+            self._emit(ListChange('remove', start, stop, items, None))
+
+    def _update(self, start: int, items: list):
+        if items:
+            self._items[start:start + len(items)] = items
+            self._emit(ListChange('update', start, start + len(items), items, None))
+
+    def _move(self, start: int, stop: int, target: int):
+        items = self._items[start:stop]
+        del self._items[start:stop]
+        self._items[target:target] = items
+        self._emit(ListChange('move', start, stop, items, target))
+
+    def _reset(self, items: list):
+        self._items = items
+        self._emit(ListChange('reset', 0, len(items), items, None))
+
+    def _subscribe(self, derived: 'ValueList'):
+        self._derived.append(weakref.ref(derived))
+
+    def _emit(self, change: ListChange):
+        derived = [ref() for ref in self._derived]
+        if None in derived:
+            self._derived = [ref for ref in self._derived if ref() is not None]
+        for sub in derived:
+            if sub is not None:
+                sub._source_changed(change)
+        for callback in self._change_callbacks:
+            callback(change)
+        self.version.set_data(self.version.data + 1)
+
+
+class MappedList(ValueList):
+    def __init__(self, source: ValueList, function: Callable[[Any], Any]):
+        super(MappedList, self).__init__(map(function, source))
+        self._source = source
+        self._function = function
+        source._subscribe(self)
+
+    def _source_changed(self, change: ListChange):
+        if change.kind == 'insert':
+            self._insert(change.start, [self._function(item) for item in change.items])
+        elif change.kind == 'remove':
+            self._remove(change.start, change.stop)
+        elif change.kind == 'update':
+            self._update(change.start, [self._function(item) for item in change.items])
+        elif change.kind == 'move':
+            self._move(change.start, change.stop, change.target)
+        else:
+            self._reset([self._function(item) for item in change.items])
+
+
+class _Flags:
+    """
+    List of booleans stored in blocks, with Fenwick trees over the block lengths and the number of true flags per
+    block, so that ``count(index)`` (the true flags before ``index``) and single flag updates take O(log n) plus one
+    block scan. Splices rebuild the trees only when a block overflows or runs empty, or when they are long.
+    """
+    BLOCK = 128
+
+    def __init__(self, flags: Iterable[bool] = ()):
+        self._build(list(flags))
+
+    def _build(self, flags: list):
+        size = self.BLOCK
+        self._blocks = [flags[i:i + size] for i in range(0, len(flags), size)] or [[]]
+        self._length = len(flags)
+        self._lengths = self._tree([len(block) for block in self._blocks])
+        self._counts = self._tree([block.count(True) for block in self._blocks])
+
+    @staticmethod
+    def _tree(values: list) -> list:
+        tree = [0] + values
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        return tree
+
+    @staticmethod
+    def _add(tree: list, block: int, delta: int):
+        i = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    @staticmethod
+    def _prefix(tree: list, block: int) -> int:
+        total = 0
+        while block > 0:
+            total += tree[block]
+            block -= block & -block
+        return total
+
+    def _locate(self, index: int):
+        """Block and offset of ``index``; the end of the list is located in the last block."""
+        tree, block, step = self._lengths, 0, 1 << (len(self._blocks).bit_length() - 1)
+        while step:
+            if block + step < len(tree) and tree[block + step] <= index:
+                block += step
+                index -= tree[block]
+            step >>= 1
+        if block == len(self._blocks):
+            block -= 1
+            index += len(self._blocks[block])
+        return block, index
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> bool:
+        block, offset = self._locate(index)
+        return self._blocks[block][offset]
+
+    def __setitem__(self, index: int, flag: bool):
+        block, offset = self._locate(index)
+        previous = self._blocks[block][offset]
+        if flag != previous:
+            self._blocks[block][offset] = flag
+            self._add(self._counts, block, 1 if flag else -1)
+
+    def count(self, index: int) -> int:
+        block, offset = self._locate(index)
+        return self._prefix(self._counts, block) + self._blocks[block][:offset].count(True)
+
+    def tolist(self) -> list:
+        return [flag for block in self._blocks for flag in block]
+
+    def slice(self, start: int, stop: int) -> list:
+        flags = []
+        while start < stop:
+            block, offset = self._locate(start)
+            flags += self._blocks[block][offset:offset + stop - start]
+            start += len(self._blocks[block]) - offset
+        return flags
+
+    def insert(self, index: int, flags: list):
+        if len(flags) > self.BLOCK:
+            items = self.tolist()
+            items[index:index] = flags
+            return self._build(items)
+        block, offset = self._locate(index)
+        self._blocks[block][offset:offset] = flags
+        self._length += len(flags)
+        if len(self._blocks[block]) > 2 * self.BLOCK:
+            return self._build(self.tolist())
+        self._add(self._lengths, block, len(flags))
+        self._add(self._counts, block, flags.count(True))
+
+    def delete(self, start: int, stop: int):
+        if stop - start > self.BLOCK:
+            items = self.tolist()
+            del items[start:stop]
+            return self._build(items)
+        while stop > start:
+            block, offset = self._locate(start)
+            flags = self._blocks[block][offset:offset + stop - start]
+            del self._blocks[block][offset:offset + len(flags)]
+            self._length -= len(flags)
+            stop -= len(flags)
+            if not self._blocks[block] and len(self._blocks) > 1:
+                self._build(self.tolist())
+            else:
+                self._add(self._lengths, block, -len(flags))
+                self._add(self._counts, block, -flags.count(True))
+
+
+class FilteredList(ValueList):
+    def __init__(self, source: ValueList, predicate: Callable[[Any], bool]):
+        # One flag per source item telling whether it is part of this list
+        self._mask = _Flags(bool(predicate(item)) for item in source)
+        super(FilteredList, self).__init__(item for item, keep in zip(source, self._mask.tolist()) if keep)
+        self._source = source
+        self._predicate = predicate
+        source._subscribe(self)
+
+    def _position(self, index: int) -> int:
+        return self._mask.count(index)
+
+    def _source_changed(self, change: ListChange):
+        if change.kind == 'insert':
+            flags = [bool(self._predicate(item)) for item in change.items]
+            position = self._position(change.start)
+            self._mask.insert(change.start, flags)
+            self._insert(position, [item for item, keep in zip(change.items, flags) if keep])
+        elif change.kind == 'remove':
+            position = self._position(change.start)
+            removed = self._position(change.stop) - position
+            self._mask.delete(change.start, change.stop)
+            self._remove(position, position + removed)
+        elif change.kind == 'update':
+            position = self._position(change.start)
+            for index, item in enumerate(change.items, change.start):
+                keep = bool(self._predicate(item))
+                kept = self._mask[index]
+                if kept and keep:
+                    self._update(position, [item])
+                elif kept:
+                    self._remove(position, position + 1)
+                elif keep:
+                    self._insert(position, [item])
+                self._mask[index] = keep
+                position += keep
+        elif change.kind == 'move':
+            position = self._position(change.start)
+            flags = self._mask.slice(change.start, change.stop)
+            self._mask.delete(change.start, change.stop)
+            target = self._position(change.target)
+            self._mask.insert(change.target, flags)
+            moved = flags.count(True)
+            if moved and target != position:
+                self._move(position, position + moved, target)
+        else:
+            flags = [bool(self._predicate(item)) for item in change.items]
+            self._mask = _Flags(flags)
+            self._reset([item for item, keep in zip(change.items, flags) if keep])
+
+
+class SortedList(ValueList):
+    def __init__(self, source: ValueList, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False):
+        self._key = key or (lambda item: item)
+        self._reverse = reverse
+        self._ids = count()
+        self._source = source
+        super(SortedList, self).__init__()
+        self._rebuild(source.data)
+        source._subscribe(self)
+
+    def _rebuild(self, items: list):
+        # Every source item gets a unique id, which makes the (key, id) entries unique and the order stable
+        self._entries = [next(self._ids) for _ in items]
+        self._order = sorted((self._key(item), entry) for item, entry in zip(items, self._entries))
+        self._values = dict(zip(self._entries, items))
+        self._items = [self._values[entry] for _, entry in self._order]
+        if self._reverse:
+            self._items.reverse()
+
+    def _output(self, position: int) -> int:
+        return len(self._order) - 1 - position if self._reverse else position
+
+    def _add(self, item, entry: int):
+        self._values[entry] = item
+        sort_key = (self._key(item), entry)
+        insort(self._order, sort_key)
+        self._insert(self._output(bisect_left(self._order, sort_key)), [item])
+
+    def _discard(self, entry: int):
+        item = self._values.pop(entry)
+        position = bisect_left(self._order, (self._key(item), entry))
+        output = self._output(position)
+        del self._order[position]
+        self._remove(output, output + 1)
+
+    def _source_changed(self, change: ListChange):
+        if change.kind == 'insert':
+            entries = [next(self._ids) for _ in change.items]
+            self._entries[change.start:change.start] = entries
+            for item, entry in zip(change.items, entries):
+                self._add(item, entry)
+        elif change.kind == 'remove':
+            for entry in self._entries[change.start:change.stop]:
+                self._discard(entry)
+            del self._entries[change.start:change.stop]
+        elif change.kind == 'update':
+            for entry, item in zip(self._entries[change.start:change.stop], change.items):
+                self._discard(entry)
+                self._add(item, entry)
+        elif change.kind == 'move':
+            entries = self._entries[change.start:change.stop]
+            del self._entries[change.start:change.stop]
+            self._entries[change.target:change.target] = entries
+        else:
+            self._rebuild(change.items)
+            self._emit(ListChange('reset', 0, len(self._items), self._items, None))
+
+
+class ValueDict:
+    """Observable dict emitting a DictChange for every key that is set or deleted."""
+
+    def __init__(self, items=(), **kwargs):
+        self._items = dict(items, **kwargs)
+        self._change_callbacks = []
+        self.version = Value(0)
+
+    @property
+    def data(self) -> dict:
+        return self._items
+
+    def on_change(self, callback: Callable[[DictChange], None]):
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable[[DictChange], None]):
+        # Rebinding keeps a running emit iterating over the previous list
+        self._change_callbacks = [other for other in self._change_callbacks if other is not callback]
+
+    def derive(self, function: Callable[[dict], Any]) -> Value:
+        """Derives a scalar Value holding ``function(items)``."""
+        return self.version.map(lambda _: function(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __repr__(self):
+        return f"ValueDict({self._items})"
+
+    def get(self, key, default=None):
+        return self._items.get(key, default)
+
+    def keys(self):
+        return self._items.keys()
+
+    def values(self):
+        return self._items.values()
+
+    def items(self):
+        return self._items.items()
+
+    @_in_gui_thread
+    def __setitem__(self, key, value):
+        previous = self._items.get(key)
+        if key in self._items and previous is value:
+            return
+        self._items[key] = value
+        self._emit(DictChange('set', key, value, previous))
+
+    @_in_gui_thread
+    def __delitem__(self, key):
+        previous = self._items.pop(key)
+        self._emit(DictChange('delete', key, None, previous))
+
+    def pop(self, key, *default):
+        if key not in self._items and default:
+            return default[0]
+        value = self._items[key]
+        del self[key]
+        return value
+
+    @_in_gui_thread
+    def update(self, items=(), **kwargs):
+        for key, value in dict(items, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self.set_data({})
+
+    @_in_gui_thread
+    def set_data(self, items):
+        self._items = dict(items)
+        self._emit(DictChange('reset', None, self._items, None))
+
+    def _emit(self, change: DictChange):
+        for callback in self._change_callbacks:
+            callback(change)
+        self.version.set_data(self.version.data + 1)
@@ -1,7 +1,12 @@
 from PyQt6 import QtGui, QtCore
-from PyQt6.QtCore import Qt, QObject, QLocale
-from PyQt6.QtGui import QDoubleValidator, QIntValidator
-from PyQt6.QtWidgets import QWidget, QLineEdit, QStyledItemDelegate, QStyleOptionViewItem, QComboBox, QPushButton
+from bisect import bisect_left
+from typing import Callable, Optional, List
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QLocale, QEvent, QPersistentModelIndex, QStringListModel, pyqtSignal
+from PyQt6.QtGui import QDoubleValidator, QIntValidator, QPainter
+from PyQt6.QtWidgets import QWidget, QLineEdit, QStyledItemDelegate, QStyleOptionViewItem, QComboBox, QStyle, \
+    QStyleOptionButton, QApplication, QAbstractItemView, QCompleter
 
 
 def to_comma_event(e: QtGui.QKeyEvent):
@@ -34,6 +39,54 @@ def to_period_event(e: QtGui.QKeyEvent):
     )
 
 
+class PooledDelegate(QStyledItemDelegate):
+    """
+    Delegate that keeps editors closed by the view and hands them out again for the next edit instead of creating
+    a new widget every time. New editors are created by ``editor_factory(parent)``.
+    """
+    pool_size = 4
+
+    def __init__(self, editor_factory: Callable[[QWidget], QWidget], parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._editor_factory = editor_factory
+        self._editors = []
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> QWidget:
+        while self._editors:
+            editor = self._editors.pop()
+            if sip.isdeleted(editor):
+                continue
+            if editor.parentWidget() is not parent:
+                editor.setParent(parent)
+            return editor
+        return self._editor_factory(parent)
+
+    def destroyEditor(self, editor: QWidget, index: QtCore.QModelIndex) -> None:
+        if len(self._editors) < self.pool_size and not sip.isdeleted(editor):
+            editor.hide()
+            self._editors.append(editor)
+        else:
+            super().destroyEditor(editor, index)
+
+
+class PrefixIndex:
+    """Sorted, case-insensitive index answering prefix queries in O(log n + matches)."""
+
+    def __init__(self, items: List[str]):
+        self._items = items
+        self._keys = sorted((item.casefold(), i) for i, item in enumerate(items))
+
+    def search(self, prefix: str, limit: int = 50) -> List[str]:
+        prefix = prefix.casefold()
+        matches = []
+        for position in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+            key, i = self._keys[position]
+            if len(matches) == limit or not key.startswith(prefix):
+                break
+            matches.append(self._items[i])
+        return matches
+
+
 class FloatInput(QLineEdit):
     floatKeys = {Qt.Key.Key_Comma, Qt.Key.Key_Period}
 
@@ -52,11 +105,12 @@ class FloatInput(QLineEdit):
         super(FloatInput, self).keyPressEvent(e)
 
 
-class FloatDelegate(QStyledItemDelegate):
+class FloatDelegate(PooledDelegate):
     def __init__(self, parent: QObject = None) -> None:
-        super().__init__(parent)
+        super().__init__(self._new_editor, parent)
 
-    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> QWidget:
+    @staticmethod
+    def _new_editor(parent: QWidget) -> QWidget:
         editor = FloatInput(parent)
         editor.setFrame(False)
         return editor
@@ -83,11 +137,12 @@ class IntegerInput(QLineEdit):
         self.setValidator(QIntValidator())
 
 
-class IntegerDelegate(QStyledItemDelegate):
+class IntegerDelegate(PooledDelegate):
     def __init__(self, parent: QObject = None) -> None:
-        super().__init__(parent)
+        super().__init__(self._new_editor, parent)
 
-    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> QWidget:
+    @staticmethod
+    def _new_editor(parent: QWidget) -> QWidget:
         editor = IntegerInput(parent)
         editor.setFrame(False)
         return editor
@@ -108,32 +163,138 @@ class IntegerDelegate(QStyledItemDelegate):
 
 
 class ButtonDelegate(QStyledItemDelegate):
-    def __init__(self, parent: QObject = None) -> None:
-        super().__init__(parent)
-
-    def createEditor(self, parent, option, index):
-        editor = QPushButton(parent, "Send Test Signal")
-        return editor
-
-    def updateEditorGeometry(self, editor, option, index):
-        editor.setGeometry(option.rect)
-
-
-
-class ComboBoxDelegate(QStyledItemDelegate):
-    def __init__(self, items=[], parent: QObject = None) -> None:
+    """
+    Paints a push button into every cell and handles its clicks itself, so no editor widget is created per row.
+    Clicks are reported through ``clicked`` and the optional ``on_click(row)`` callback. Without ``text``, the
+    button shows the display data of the cell.
+    """
+    clicked = pyqtSignal(QtCore.QModelIndex)
+
+    def __init__(
+            self,
+            parent: QObject = None,
+            text: Optional[str] = "Send Test Signal",
+            on_click: Callable[[int], None] = None,
+    ) -> None:
         super().__init__(parent)
+        self.text = text
+        self.on_click = on_click
+        self._pressed = QPersistentModelIndex()
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        button = QStyleOptionButton()
+        button.rect = option.rect
+        button.text = self.text if self.text is not None else str(index.data() or "")
+        button.state = option.state & QStyle.StateFlag.State_Enabled
+        if self._pressed.isValid() and self._pressed == QPersistentModelIndex(index):
+            button.state |= QStyle.StateFlag.State_Sunken
+        else:
+            button.state |= QStyle.StateFlag.State_Raised
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(
+            self,
+            event: QEvent,
+            model: QtCore.QAbstractItemModel,
+            option: QStyleOptionViewItem,
+            index: QtCore.QModelIndex
+    ) -> bool:
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                                QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        inside = option.rect.contains(event.position().toPoint())
+
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            pressed, self._pressed = self._pressed, QPersistentModelIndex()
+            self._repaint(option, pressed)
+            if inside and pressed.isValid() and pressed == QPersistentModelIndex(index):
+                self.clicked.emit(index)
+                if self.on_click is not None:
+                    self.on_click(index.row())
+            return True
+
+        if inside:
+            self._pressed = QPersistentModelIndex(index)
+            self._repaint(option, self._pressed)
+        return inside
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        return None
+
+    @staticmethod
+    def _repaint(option: QStyleOptionViewItem, index: QPersistentModelIndex):
+        if isinstance(option.widget, QAbstractItemView) and index.isValid():
+            option.widget.update(QtCore.QModelIndex(index))
+
+
+class ComboBoxDelegate(PooledDelegate):
+    """
+    All editors share one item model. Lists longer than ``filter_threshold`` get an editable combo box with a
+    type-ahead popup backed by a PrefixIndex, showing at most ``max_matches`` items.
+    """
+
+    def __init__(
+            self,
+            items: List[str] = [],
+            parent: QObject = None,
+            filter_threshold: int = 1000,
+            max_matches: int = 50,
+    ) -> None:
+        super().__init__(self._new_editor, parent)
         self.items = items
-
-    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> QWidget:
+        self.filter_threshold = filter_threshold
+        self.max_matches = max_matches
+        self._model = QStringListModel(items, self)
+        self._positions = None
+        self._index = None
+
+    def _position(self, text: str) -> int:
+        if self._positions is None:
+            self._positions = {item: i for i, item in reversed(list(enumerate(self.items)))}
+        return self._positions.get(text, -1)
+
+    def _new_editor(self, parent: QWidget) -> QWidget:
         editor = QComboBox(parent)
-        editor.addItems(self.items)
+        editor.setModel(self._model)
+        editor.view().setUniformItemSizes(True)
         editor.setFrame(False)
+        if len(self.items) > self.filter_threshold:
+            editor.setEditable(True)
+            editor.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+            completer = QCompleter(QStringListModel(editor), editor)
+            completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+            completer.activated[str].connect(lambda text: editor.setCurrentIndex(self._position(text)))
+            editor.setCompleter(completer)
+            editor.lineEdit().textEdited.connect(lambda text: self._filter(completer, text))
         return editor
 
+    def _filter(self, completer: QCompleter, text: str) -> None:
+        if self._index is None:
+            self._index = PrefixIndex(self.items)
+        completer.model().setStringList(self._index.search(text, self.max_matches) if text else [])
+        completer.complete()
+
+    def setEditorData(self, editor: QWidget, index: QtCore.QModelIndex) -> None:
+        editor.__class__ = QComboBox
+        value = index.model().data(index, Qt.ItemDataRole.EditRole)
+        if isinstance(value, str):
+            value = self._position(value)
+        editor.setCurrentIndex(value if isinstance(value, int) else -1)
+        if editor.isEditable():
+            # A pooled editor still holds the matches of its previous edit
+            editor.completer().model().setStringList([])
+            editor.lineEdit().selectAll()
+
     def setModelData(self, editor: QWidget, model: QtCore.QAbstractItemModel, index: QtCore.QModelIndex) -> None:
         editor.__class__ = QComboBox
         value = editor.currentIndex()
+        if editor.isEditable():
+            value = self._position(editor.currentText())
+            if value < 0:
+                return
         model.setData(index, value, Qt.ItemDataRole.EditRole)
 
     def updateEditorGeometry(self, editor: QWidget, option: 'QStyleOptionViewItem', index: QtCore.QModelIndex) -> None:
@@ -0,0 +1,186 @@
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Any, Optional
+
+from PyQt6.QtCore import QTimer
+
+from .value import Value, _call_in_gui_thread
+
+_executor = None
+
+
+def _install_dispatcher():
+    """Installs the GuiDispatcher unless a dispatcher is set already, see ``set_dispatcher``."""
+    from . import value
+    if value._dispatcher is None:
+        from .ui import GuiDispatcher
+        GuiDispatcher.install()
+
+
+def _default_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='pyquantum')
+    return _executor
+
+
+class Debouncer:
+    """Passes on the last received value once no new value arrived for ``ms`` milliseconds."""
+
+    def __init__(self, ms: int, sink: Callable[[Any], None]):
+        self._sink = sink
+        self._value = None
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(ms)
+        self._timer.timeout.connect(self._emit)
+
+    def __call__(self, value):
+        self._value = value
+        self._timer.start()
+
+    def _emit(self):
+        value, self._value = self._value, None
+        self._sink(value)
+
+
+class Throttler:
+    """Passes on the first value immediately and then at most one value, the latest, per ``ms`` milliseconds."""
+
+    def __init__(self, ms: int, sink: Callable[[Any], None]):
+        self._sink = sink
+        self._value = None
+        self._pending = False
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(ms)
+        self._timer.timeout.connect(self._emit)
+
+    def __call__(self, value):
+        if self._timer.isActive():
+            self._value = value
+            self._pending = True
+        else:
+            self._sink(value)
+            self._timer.start()
+
+    def _emit(self):
+        if self._pending:
+            value, self._value, self._pending = self._value, None, False
+            self._sink(value)
+            self._timer.start()
+
+
+class Sampler:
+    """Passes on the latest received value every ``ms`` milliseconds, if a new one arrived since the last tick."""
+
+    def __init__(self, ms: int, sink: Callable[[Any], None]):
+        self._sink = sink
+        self._value = None
+        self._pending = False
+        self._timer = QTimer()
+        self._timer.setInterval(ms)
+        self._timer.timeout.connect(self._emit)
+
+    def __call__(self, value):
+        self._value = value
+        self._pending = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _emit(self):
+        if not self._pending:
+            self._timer.stop()
+            return
+        value, self._value, self._pending = self._value, None, False
+        self._sink(value)
+
+
+class Distinct:
+    """Passes on a value only if its key differs from the key of the last value passed on, starting at ``initial``."""
+
+    def __init__(self, key: Callable[[Any], Any], sink: Callable[[Any], None], initial):
+        self._sink = sink
+        self._key = key
+        self._last = key(initial)
+
+    def __call__(self, value):
+        key = self._key(value)
+        if key != self._last:
+            self._last = key
+            self._sink(value)
+
+
+class OperatorValue(Value):
+    """Value that follows ``source`` through an operator deciding when, and which, upstream data is passed on."""
+    __slots__ = ('_operator',)
+
+    def __init__(self, source: Value, operator: Callable[[Callable[[Any], None]], Callable[[Any], None]]):
+        super(OperatorValue, self).__init__(source.data, _children=(source,))
+        ref = weakref.ref(self)
+
+        def sink(data):
+            out = ref()
+            if out is not None:
+                out.set_data(data)
+
+        self._operator = operator(sink)
+
+    def _update(self, publisher):
+        self._operator(publisher.data)
+        if self.update_callbacks:
+            self.value_update(publisher.data)
+
+
+class AsyncValue(Value):
+    """
+    Value holding ``function(source.data)`` computed on ``executor``. Only the result for the latest source data is
+    taken over: older results are discarded, and calls that did not start yet are cancelled. Results are applied back
+    on the GUI thread through the dispatcher (see ``set_dispatcher``); the GuiDispatcher is installed unless another
+    dispatcher is set, which requires creating the AsyncValue on the GUI thread. ``pending`` is True while a call is
+    running and ``error`` holds the exception raised by the last call, or None.
+    """
+    __slots__ = ('_async_function', '_executor', '_future', '_generation', 'pending', 'error')
+
+    def __init__(self, source: Value, function: Callable, executor: Optional[Executor] = None, initial=None):
+        super(AsyncValue, self).__init__(initial, _children=(source,))
+        self._async_function = function
+        self._executor = executor or _default_executor()
+        self._future = None
+        self._generation = 0
+        self.pending = Value(False)
+        self.error = Value(None, compare='identity')
+        _install_dispatcher()
+        self._submit(source.data)
+
+    def _submit(self, data):
+        if self._future is not None:
+            self._future.cancel()
+        self._generation += 1
+        generation = self._generation
+        self.pending.set_data(True)
+        ref = weakref.ref(self)
+
+        def done(future: Future):
+            out = ref()
+            if out is not None:
+                _call_in_gui_thread(out._deliver, generation, future)
+
+        self._future = self._executor.submit(self._async_function, data)
+        self._future.add_done_callback(done)
+
+    def _deliver(self, generation: int, future: Future):
+        if generation != self._generation or future.cancelled():
+            return
+        self._future = None
+        error = future.exception()
+        with Value.batch():
+            if error is None:
+                self.set_data(future.result())
+            self.error.set_data(error)
+            self.pending.set_data(False)
+
+    def _update(self, publisher):
+        self._submit(publisher.data)
+        if self.update_callbacks:
+            self.value_update(publisher.data)
@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import List
+
+from . import value
+from .value import Observer
+
+
+def _name(function) -> str:
+    return getattr(function, '__qualname__', None) or getattr(function, '__name__', None)
+
+
+def _label(node) -> str:
+    """Short name of a node: its type and id, plus the function or first callback it runs."""
+    function = getattr(node, '_function', None)
+    if function is None and node.update_callbacks:
+        function = node.update_callbacks[0]
+    name = _name(function)
+    label = f"{type(node).__name__}#{node._id}"
+    return f"{label} {name}" if name else label
+
+
+class NodeStats:
+    """Accumulated updates of one node; times are in seconds."""
+    __slots__ = ('label', 'count', 'total', 'max', 'depth', 'sources')
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.depth = 0
+        self.sources = Counter()
+
+    def __repr__(self):
+        return f"NodeStats({self.label!r}, count={self.count}, total={self.total:.6f})"
+
+
+class Profiler:
+    """
+    Records every node update of the propagation engine while running: update counts, wall time, the depth of the
+    node in the cascade and the Value whose ``set_data`` triggered it. Lazy Values recomputed on read (source
+    ``'read'``) and widget updates run later by an UpdateScheduler (source ``'scheduler'``) are recorded as well.
+    Use it as a context manager (or ``start`` and ``stop``), then read ``stats``, print ``summary()`` or write
+    ``export_chrome_trace(path)`` for chrome://tracing and Perfetto. A stopped profiler costs one check per
+    propagation.
+    """
+
+    def __init__(self, trace: bool = True, max_events: int = 1_000_000):
+        self.trace = trace
+        self.max_events = max_events
+        self.cascades = 0
+        self._stats = {}
+        self._events = []
+        # Source and depth of every node updated in the running cascade
+        self._origins = {}
+        self._start = None
+
+    def start(self) -> 'Profiler':
+        value.set_profiler(self)
+        return self
+
+    def stop(self):
+        if value._profiler is self:
+            value.set_profiler(None)
+
+    def __enter__(self) -> 'Profiler':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def clear(self):
+        self.cascades = 0
+        self._stats.clear()
+        self._events.clear()
+
+    def begin(self):
+        self._start = time.perf_counter_ns()
+
+    def end(self):
+        end = time.perf_counter_ns()
+        self.cascades += 1
+        if self._origins:
+            source = next(iter(self._origins.values()))[0]
+            self._event('propagate', 'cascade', self._start, end, {'source': source, 'nodes': len(self._origins)})
+        self._origins.clear()
+
+    def record(self, node, publisher):
+        source, depth = self._origins.get(publisher, (None, 0))
+        if source is None:
+            source = _label(publisher)
+        depth += 1
+        self._origins[node] = (source, depth)
+        start = time.perf_counter_ns()
+        try:
+            node._update(publisher)
+        finally:
+            category = 'observer' if isinstance(node, Observer) else 'value'
+            self._account(node._id, lambda: _label(node), category, start, depth, source)
+
+    def compute(self, node):
+        """Recomputes a stale lazy node whose data is read and returns its data."""
+        start = time.perf_counter_ns()
+        try:
+            return node._compute()
+        finally:
+            self._account(node._id, lambda: _label(node), 'lazy', start, 0, 'read')
+
+    def call(self, callback, args: tuple):
+        """Runs a widget update deferred by an UpdateScheduler."""
+        start = time.perf_counter_ns()
+        try:
+            callback(*args)
+        finally:
+            # Keyed by name, so that the profiler does not keep widgets alive
+            label = _name(callback) or type(callback).__name__
+            self._account(label, lambda: label, 'widget', start, 0, 'scheduler')
+
+    def _account(self, key, label, category: str, start: int, depth: int, source: str):
+        end = time.perf_counter_ns()
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = NodeStats(label())
+        elapsed = (end - start) / 1e9
+        stats.count += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        stats.depth = max(stats.depth, depth)
+        stats.sources[source] += 1
+        self._event(stats.label, category, start, end, {'depth': depth, 'source': source})
+
+    def _event(self, name: str, category: str, start: int, end: int, args: dict):
+        if self.trace and len(self._events) < self.max_events:
+            self._events.append((name, category, start, end, args))
+
+    @property
+    def stats(self) -> List[NodeStats]:
+        """Statistics of all updated nodes, most expensive first."""
+        return sorted(self._stats.values(), key=lambda stats: stats.total, reverse=True)
+
+    def summary(self, limit: int = 20) -> str:
+        stats = self.stats
+        total = sum(node.total for node in stats)
+        lines = [
+            f"{self.cascades} propagations, {sum(node.count for node in stats)} updates, {total * 1e3:.3f} ms",
+            f"{'total ms':>10} {'count':>8} {'mean us':>10} {'max us':>10} {'depth':>6}  node (top source)",
+        ]
+        for node in stats[:limit]:
+            source = node.sources.most_common(1)[0][0] if node.sources else ''
+            lines.append(
+                f"{node.total * 1e3:10.3f} {node.count:8d} {node.total / node.count * 1e6:10.1f} "
+                f"{node.max * 1e6:10.1f} {node.depth:6d}  {node.label} ({source})"
+            )
+        return '\n'.join(lines)
+
+    def chrome_trace(self) -> dict:
+        pid, tid = os.getpid(), threading.get_ident()
+        return {
+            'traceEvents': [
+                {
+                    'name': name, 'cat': category, 'ph': 'X', 'ts': start / 1e3, 'dur': (end - start) / 1e3,
+                    'pid': pid, 'tid': tid, 'args': args,
+                }
+                for name, category, start, end, args in self._events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def export_chrome_trace(self, path: str):
+        with open(path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
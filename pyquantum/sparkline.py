@@ -0,0 +1,170 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QPen
+from PyQt6.QtWidgets import QWidget
+
+from .array import SeriesValue
+from .ui import UpdateScheduler, bind_observer, _updater
+from .value import Observer
+
+
+class Sparkline(QWidget):
+    """
+    Line plot of the last ``window`` samples (default: all) of a SeriesValue. Samples are reduced to their minimum and
+    maximum per pixel column as they arrive, and only the columns of new samples are drawn into a cached pixmap that
+    is scrolled along, so the cost of an update depends on the number of new samples and the widget width only.
+    ``y_range`` fixes the vertical axis, otherwise it follows the visible samples.
+    """
+    def __init__(
+            self,
+            parent: Optional[QWidget],
+            series: SeriesValue,
+            window: int = None,
+            y_range: Tuple[float, float] = None,
+            color: QColor = None,
+            min_width: int = None,
+            max_width: int = None,
+            stretch: int = 0,
+            coalesce: Union[bool, UpdateScheduler] = True,
+    ):
+        super(Sparkline, self).__init__(parent=parent)
+        self._series = series
+        self._window = window or series.capacity
+        self._fixed_range = y_range
+        self._pen = QPen(color or self.palette().text().color())
+        self._pixmap = None
+        self._reset()
+        self._series_observer = bind_observer(self, Observer([series]))
+        self._series_observer.on_update(_updater(self._series_changed, coalesce))
+        self.setMinimumHeight(16)
+
+        if min_width is not None:
+            self.setMinimumWidth(min_width)
+
+        if max_width is not None:
+            self.setMaximumWidth(max_width)
+
+        self._stretch = stretch
+
+    def _reset(self):
+        width = max(self.width(), 1)
+        # Samples per pixel column; column c holds the minimum and maximum of the samples [c * spp, (c + 1) * spp)
+        self._spp = max(-(-self._window // width), 1)
+        self._mins = np.full(width, np.nan)
+        self._maxs = np.full(width, np.nan)
+        self._last_column = -1
+        self._seen = self._series.total - self._series.count
+        self._resets = self._series.resets
+        self._range = None
+        self._pixmap = None
+
+    def _series_changed(self, _=None):
+        series = self._series
+        if series.resets != self._resets:
+            self._reset()
+        new = series.total - self._seen
+        if new <= 0:
+            return
+        new = min(new, series.count, self._window)
+        first = series.total - new
+        self._seen = series.total
+        dirty = self._add_columns(first, series.window(new))
+        y_range = self._y_range()
+        if self._pixmap is None or y_range != self._range:
+            self._range = y_range
+            self._pixmap = None
+        elif dirty:
+            self._draw_columns(dirty)
+        self.update()
+
+    def _add_columns(self, first: int, samples: np.ndarray) -> int:
+        """Merges ``samples`` (starting at absolute index ``first``) into the columns, returns the columns changed."""
+        spp = self._spp
+        offset = -first % spp
+        starts = np.arange(offset, len(samples), spp)
+        if offset and len(samples):
+            starts = np.concatenate(([0], starts))
+        mins = np.minimum.reduceat(samples, starts).astype(float)
+        maxs = np.maximum.reduceat(samples, starts).astype(float)
+        last = (first + len(samples) - 1) // spp
+        width = len(self._mins)
+        shift = last - self._last_column if self._last_column >= 0 else width
+        if shift >= width:
+            self._mins.fill(np.nan)
+            self._maxs.fill(np.nan)
+        elif shift > 0:
+            self._mins[:-shift] = self._mins[shift:]
+            self._maxs[:-shift] = self._maxs[shift:]
+            self._mins[-shift:] = np.nan
+            self._maxs[-shift:] = np.nan
+            if self._pixmap is not None:
+                self._pixmap.scroll(-shift, 0, self._pixmap.rect())
+        self._last_column = last
+        mins, maxs = mins[-width:], maxs[-width:]
+        columns = len(mins)
+        self._mins[-columns:] = np.fmin(self._mins[-columns:], mins)
+        self._maxs[-columns:] = np.fmax(self._maxs[-columns:], maxs)
+        # The column before the new ones is redrawn too, it connects to them
+        return min(columns + 1, width)
+
+    def _y_range(self) -> Tuple[float, float]:
+        if self._fixed_range is not None:
+            return self._fixed_range
+        if np.isnan(self._mins).all():
+            return 0.0, 1.0
+        low, high = float(np.nanmin(self._mins)), float(np.nanmax(self._maxs))
+        if self._range is not None:
+            # Keep the current range while it still fits well, otherwise every sample could trigger a full redraw
+            current_low, current_high = self._range
+            span = current_high - current_low
+            if current_low <= low and high <= current_high and high - low > span / 2:
+                return self._range
+        margin = (high - low) * 0.1 or 0.5
+        return low - margin, high + margin
+
+    def _draw_columns(self, count: int):
+        width, height = self._pixmap.width(), self._pixmap.height()
+        painter = QPainter(self._pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(width - count, 0, count, height, Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setPen(self._pen)
+        low, high = self._range
+        scale = (height - 1) / (high - low)
+        start = width - count
+        mins = self._mins[max(start - 1, 0):]
+        maxs = self._maxs[max(start - 1, 0):]
+        # Every column spans from its minimum to its maximum, extended to reach the previous column
+        previous_mins, previous_maxs = np.roll(mins, 1), np.roll(maxs, 1)
+        top = np.fmax(maxs, previous_mins)
+        bottom = np.fmin(mins, previous_maxs)
+        if start > 0:
+            top, bottom, maxs = top[1:], bottom[1:], maxs[1:]
+        else:
+            top[0], bottom[0] = maxs[0], mins[0]
+        top = np.round((height - 1) - (top - low) * scale)
+        bottom = np.round((height - 1) - (bottom - low) * scale)
+        for x in np.flatnonzero(~np.isnan(maxs)).tolist():
+            painter.drawLine(start + x, int(top[x]), start + x, int(bottom[x]))
+        painter.end()
+
+    def _render(self):
+        self._pixmap = QPixmap(max(self.width(), 1), max(self.height(), 1))
+        self._pixmap.fill(Qt.GlobalColor.transparent)
+        if self._range is None:
+            self._range = self._y_range()
+        self._draw_columns(self._pixmap.width())
+
+    def paintEvent(self, event):
+        if self._pixmap is None or self._pixmap.size() != self.size():
+            self._render()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super(Sparkline, self).resizeEvent(event)
+        self._reset()
+        self._series_changed()
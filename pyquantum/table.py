@@ -0,0 +1,213 @@
+from contextlib import contextmanager
+from typing import List, Union, Optional, Sequence
+
+import numpy as np
+from PyQt6.QtCore import Qt, QObject, QAbstractTableModel, QModelIndex
+from PyQt6.QtWidgets import QAbstractItemView, QStyledItemDelegate
+
+from .delegates import FloatDelegate, IntegerDelegate, ComboBoxDelegate
+
+# Display strings are formatted per block of rows with one vectorized call and cached, so that scrolling does not
+# create Python objects cell by cell.
+_BLOCK_SIZE = 256
+_CACHED_BLOCKS = 4096
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_NUMBER_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class TableColumn:
+    """
+    Typed column of a ColumnarTableModel, backed by a NumPy array.
+
+    ``kind`` is one of ``'float'``, ``'int'``, ``'category'`` (integer codes into ``items``) or ``'str'``; the first
+    three are edited with FloatDelegate, IntegerDelegate and ComboBoxDelegate respectively.
+    """
+    dtypes = {'float': np.float64, 'int': np.int64, 'category': np.int32, 'str': object}
+
+    def __init__(
+            self,
+            name: str,
+            kind: str = 'float',
+            values: Optional[Sequence] = None,
+            items: List[str] = None,
+            fmt: str = '%.3f',
+            editable: bool = True,
+    ):
+        if kind not in TableColumn.dtypes:
+            raise ValueError(f"Column kind must be one of {', '.join(TableColumn.dtypes)}")
+        if kind == 'category' and items is None:
+            raise ValueError("Category columns need items")
+        self.name = name
+        self.kind = kind
+        self.values = np.asarray(values if values is not None else [], dtype=TableColumn.dtypes[kind])
+        self.items = np.asarray(items, dtype=object) if items is not None else None
+        self.fmt = fmt
+        self.editable = editable
+
+    def format(self, values: np.ndarray) -> list:
+        if self.kind == 'float':
+            return np.char.mod(self.fmt, values).tolist()
+        if self.kind == 'int':
+            return values.astype(str).tolist()
+        if self.kind == 'category':
+            return self.items.take(values).tolist()
+        return [str(value) for value in values.tolist()]
+
+    def delegate(self, parent: QObject = None) -> Optional[QStyledItemDelegate]:
+        if self.kind == 'float':
+            return FloatDelegate(parent)
+        if self.kind == 'int':
+            return IntegerDelegate(parent)
+        if self.kind == 'category':
+            return ComboBoxDelegate(self.items.tolist(), parent)
+        return None
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    def __init__(self, columns: List[TableColumn], parent: QObject = None):
+        super(ColumnarTableModel, self).__init__(parent)
+        if len({len(column.values) for column in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+        self._columns = columns
+        self._rows = len(columns[0].values) if columns else 0
+        self._cache = {}
+        self._pending = None
+        self._delegates = []
+        self._flags = None
+
+    @property
+    def columns(self) -> List[TableColumn]:
+        return self._columns
+
+    def column(self, column: Union[int, str]) -> int:
+        if isinstance(column, str):
+            for i, candidate in enumerate(self._columns):
+                if candidate.name == column:
+                    return i
+            raise KeyError(column)
+        return column
+
+    def install_delegates(self, view: QAbstractItemView):
+        """Sets the delegate matching the type of every column on ``view``."""
+        for i, column in enumerate(self._columns):
+            delegate = column.delegate(view)
+            if delegate is not None:
+                self._delegates.append(delegate)
+                view.setItemDelegateForColumn(i, delegate)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section].name
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            row, column = index.row(), index.column()
+            block = self._cache.get((column, row // _BLOCK_SIZE))
+            if block is None:
+                block = self._format_block(column, row // _BLOCK_SIZE)
+            return block[row % _BLOCK_SIZE]
+        if role == _EDIT_ROLE:
+            value = self._columns[index.column()].values[index.row()]
+            return value.item() if isinstance(value, np.generic) else value
+        if role == _ALIGNMENT_ROLE and self._columns[index.column()].kind in ('float', 'int'):
+            return _NUMBER_ALIGNMENT
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return super(ColumnarTableModel, self).flags(index)
+        if self._flags is None:
+            base = super(ColumnarTableModel, self).flags(index)
+            self._flags = [base | Qt.ItemFlag.ItemIsEditable if column.editable else base for column in self._columns]
+        return self._flags[index.column()]
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole or value is None:
+            return False
+        column = self._columns[index.column()]
+        if column.kind == 'category' and not 0 <= value < len(column.items):
+            return False
+        column.values[index.row()] = value
+        self._changed(index.row(), index.row() + 1, index.column(), index.column() + 1)
+        return True
+
+    def update(self, column: Union[int, str], start: int, values: Sequence):
+        """Writes ``values`` into ``column`` starting at row ``start``, emitting a single dataChanged."""
+        column = self.column(column)
+        values = np.asarray(values)
+        self._columns[column].values[start:start + len(values)] = values
+        self._changed(start, start + len(values), column, column + 1)
+
+    def set_columns(self, values: dict):
+        """Replaces the data of the given columns (by name or index), resetting the model if the row count changes."""
+        columns = [self.column(column) for column in values]
+        values = {
+            column: np.asarray(data, dtype=TableColumn.dtypes[self._columns[column].kind])
+            for column, data in zip(columns, values.values())
+        }
+        rows = {len(data) for data in values.values()}
+        if len(rows) > 1:
+            raise ValueError("All columns must have the same length")
+        if rows and rows != {self._rows}:
+            if len(values) != len(self._columns):
+                raise ValueError("Changing the number of rows requires data for every column")
+            self.beginResetModel()
+            for column, data in values.items():
+                self._columns[column].values = data
+            self._rows = rows.pop()
+            self._cache.clear()
+            self.endResetModel()
+            return
+        for column, data in values.items():
+            self._columns[column].values = data
+            self._changed(0, self._rows, column, column + 1)
+
+    @contextmanager
+    def batch(self):
+        """Collects all changes made inside the block into one dataChanged for their bounding range."""
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._emit_changed(
+                    min(change[0] for change in pending),
+                    max(change[1] for change in pending),
+                    min(change[2] for change in pending),
+                    max(change[3] for change in pending),
+                )
+
+    def _format_block(self, column: int, block: int) -> list:
+        start = block * _BLOCK_SIZE
+        formatted = self._columns[column].format(self._columns[column].values[start:start + _BLOCK_SIZE])
+        if len(self._cache) >= _CACHED_BLOCKS:
+            del self._cache[next(iter(self._cache))]
+        self._cache[(column, block)] = formatted
+        return formatted
+
+    def _changed(self, start: int, stop: int, first: int, last: int):
+        for column in range(first, last):
+            for block in range(start // _BLOCK_SIZE, (stop - 1) // _BLOCK_SIZE + 1):
+                self._cache.pop((column, block), None)
+        if self._pending is not None:
+            self._pending.append((start, stop, first, last))
+        else:
+            self._emit_changed(start, stop, first, last)
+
+    def _emit_changed(self, start: int, stop: int, first: int, last: int):
+        self.dataChanged.emit(self.index(start, first), self.index(stop - 1, last - 1))
@@ -1,22 +1,271 @@
+import threading
+import weakref
+from bisect import bisect_left
 from pathlib import Path
-from typing import Union, List, Optional, Callable
+from typing import Union, List, Optional, Callable, Sequence
 
-from PyQt6.QtCore import Qt
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QTimer, QObject, QCoreApplication, QThread, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import QLabel, QWidget, QPushButton, QLineEdit, QPlainTextEdit, QHBoxLayout, QLayout, QVBoxLayout, \
-    QGridLayout, QSplitter, QFrame, QFileDialog, QComboBox, QTabWidget
+    QGridLayout, QSplitter, QFrame, QFileDialog, QComboBox, QTabWidget, QAbstractScrollArea, \
+    QBoxLayout
 
-from .value import Value, Observer
+from .collection import ValueList
+from .operators import Debouncer, Throttler
+from . import value as _value
+from .value import Value, Observer, TextValue, set_dispatcher, _call_profiled
+
+
+_NOT_QUEUED = object()
+
+
+class _Scheduled:
+    """Callback queueing ``callback`` on ``scheduler``."""
+    __slots__ = ('scheduler', 'callback')
+
+    def __init__(self, scheduler: 'UpdateScheduler', callback: Callable):
+        self.scheduler = scheduler
+        self.callback = callback
+
+    def __call__(self, value):
+        self.scheduler.schedule(self.callback, value)
+
+
+class UpdateScheduler:
+    """
+    Coalesces widget updates: every queued callback runs at most once per flush, with the last value it received.
+    With ``interval=0`` the queue is flushed on the next event-loop turn, otherwise at most every ``interval``
+    milliseconds (e.g. 16 for once per display frame).
+    """
+    _default = None
+
+    def __init__(self, interval: int = 0):
+        self._queue = {}
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+
+    @classmethod
+    def default(cls) -> 'UpdateScheduler':
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def schedule(self, callback: Callable, value):
+        self._queue[callback] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def wrap(self, callback: Callable) -> Callable:
+        return _Scheduled(self, callback)
+
+    def cancel(self, callback: Callable) -> bool:
+        """Drops the queued call of ``callback``; returns whether one was queued."""
+        return self._queue.pop(callback, _NOT_QUEUED) is not _NOT_QUEUED
+
+    def flush(self):
+        queue, self._queue = self._queue, {}
+        for callback, value in queue.items():
+            receiver = getattr(callback, '__self__', None)
+            if isinstance(receiver, QObject) and sip.isdeleted(receiver):
+                continue
+            _call_profiled(callback, value)
+
+
+class GuiDispatcher(QObject):
+    """
+    Applies Value writes made by worker threads on the GUI thread. Writes are collected in a lock-protected queue
+    that keeps only the latest data per Value and is drained in bulk, inside one batch, by the Qt event loop.
+    """
+    _instance = None
+    _wake = pyqtSignal()
+
+    def __init__(self):
+        super(GuiDispatcher, self).__init__()
+        self._lock = threading.Lock()
+        self._values = {}
+        self._calls = []
+        self._wake.connect(self.drain, Qt.ConnectionType.QueuedConnection)
+
+    @classmethod
+    def install(cls) -> 'GuiDispatcher':
+        """Must be called from the GUI thread; pyquantum widgets do so when they bind to a Value."""
+        if cls._instance is None or _value._dispatcher is None:
+            app = QCoreApplication.instance()
+            if app is not None and QThread.currentThread() is not app.thread():
+                raise RuntimeError("GuiDispatcher must be installed from the GUI thread")
+            if cls._instance is None:
+                cls._instance = cls()
+            set_dispatcher(cls._instance)
+        return cls._instance
+
+    def post(self, value: Value, data):
+        with self._lock:
+            idle = not self._values and not self._calls
+            self._values[value] = data
+        if idle:
+            self._wake.emit()
+
+    def call(self, function: Callable, *args):
+        with self._lock:
+            idle = not self._values and not self._calls
+            self._calls.append((function, args))
+        if idle:
+            self._wake.emit()
+
+    def drain(self):
+        with self._lock:
+            values, self._values = self._values, {}
+            calls, self._calls = self._calls, []
+        with Value.batch():
+            for value, data in values.items():
+                value.set_data(data)
+        for function, args in calls:
+            function(*args)
+
+
+def bind_observer(owner: QObject, observer: Observer) -> Observer:
+    """
+    Keeps ``observer`` alive as long as ``owner`` (a widget or layout) and suspends it while ``owner`` is on a hidden
+    tab of a TabView with ``suspend_hidden``.
+    """
+    observers = owner.__dict__.setdefault('_observers', [])
+    observers.append(observer)
+    return observer
+
+
+def _updater(callback: Callable, coalesce: Union[bool, UpdateScheduler]) -> Callable:
+    GuiDispatcher.install()
+    if coalesce is False:
+        return callback
+    scheduler = UpdateScheduler.default() if coalesce is True else coalesce
+    return scheduler.wrap(callback)
+
+
+def _rate_limited(sink: Callable, debounce: Optional[int], throttle: Optional[int]) -> Callable:
+    if debounce is not None:
+        return Debouncer(debounce, sink)
+    if throttle is not None:
+        return Throttler(throttle, sink)
+    return sink
+
+
+def _bind_items(owner: QObject, source: Union[ValueList, Value, Sequence]) -> Sequence:
+    """Calls ``owner._set_items(items)`` whenever the list held by ``source`` changes and returns the current items."""
+    if isinstance(source, ValueList):
+        owner_ref = weakref.ref(owner)
+
+        def changed(_):
+            owner = owner_ref()
+            if owner is None or sip.isdeleted(owner):
+                source.remove_change_callback(changed)
+            else:
+                owner._set_items(source.data)
+
+        source.on_change(changed)
+        owner.destroyed.connect(lambda *_: source.remove_change_callback(changed))
+        return source.data
+    if isinstance(source, Value):
+        owner._source_observer = bind_observer(owner, Observer([source]))
+        owner._source_observer.on_update(owner._set_items)
+        return source.data
+    return source
+
+
+def _as_widget(content: Union[QWidget, QLayout]) -> QWidget:
+    if isinstance(content, QLayout):
+        widget = QWidget()
+        widget.setLayout(content)
+        return widget
+    return content
 
 
 class TabView(QTabWidget):
+    """
+    Tabs are given as widgets or as factories returning the widget (or layout) of the tab. A factory only runs when
+    its tab is shown for the first time or, with ``prewarm``, one tab per event-loop turn once the window is idle.
+    With ``suspend_hidden``, the Observers of hidden tabs (those registered with ``bind_observer``, as by all widgets
+    of this module) are suspended and catch up when their tab is shown again.
+    """
     def __init__(
             self,
             parent: QWidget,
-            tabs: dict[str, QWidget],
+            tabs: dict[str, Union[QWidget, Callable[[], Union[QWidget, QLayout]]]],
+            prewarm: bool = False,
+            suspend_hidden: bool = False,
     ):
         super(TabView, self).__init__(parent=parent)
-        for name, widget in tabs.items():
-            self.addTab(widget, name)
+        self._factories = {}
+        self._suspend_hidden = suspend_hidden
+        self._shown = None
+        for name, tab in tabs.items():
+            if isinstance(tab, QWidget):
+                self.addTab(tab, name)
+            else:
+                page = QWidget()
+                layout = QVBoxLayout(page)
+                layout.setContentsMargins(0, 0, 0, 0)
+                self._factories[page] = tab
+                self.addTab(page, name)
+
+        if suspend_hidden:
+            for index in range(self.count()):
+                if index != self.currentIndex():
+                    self._set_suspended(self.widget(index), True)
+        self._tab_changed(self.currentIndex())
+        self.currentChanged.connect(self._tab_changed)
+        if prewarm and self._factories:
+            QTimer.singleShot(0, self._prewarm)
+
+    def build(self, index: int) -> QWidget:
+        """Builds the tab at ``index`` unless it was built already and returns its page."""
+        page = self.widget(index)
+        factory = self._factories.pop(page, None)
+        if factory is not None:
+            content = factory()
+            if isinstance(content, QLayout):
+                page.layout().addLayout(content)
+            else:
+                page.layout().addWidget(content)
+            if self._suspend_hidden and page is not self._shown:
+                self._set_suspended(page, True)
+        return page
+
+    def _tab_changed(self, index: int):
+        if index < 0:
+            return
+        page = self.build(index)
+        if self._suspend_hidden and page is not self._shown:
+            if self._shown is not None and not sip.isdeleted(self._shown):
+                self._set_suspended(self._shown, True)
+            self._set_suspended(page, False)
+        self._shown = page
+
+    def _prewarm(self):
+        if sip.isdeleted(self):
+            return
+        for page in self._factories:
+            self.build(self.indexOf(page))
+            break
+        if self._factories:
+            QTimer.singleShot(0, self._prewarm)
+
+    @staticmethod
+    def _set_suspended(page: QWidget, suspended: bool):
+        # Layouts such as ForEach are children of the page too
+        for owner in [page, *page.findChildren(QObject)]:
+            for observer in getattr(owner, '_observers', ()):
+                if not suspended:
+                    observer.resume()
+                    continue
+                # Updates still queued for the hidden widgets are dropped and caught up with on resume
+                cancelled = [
+                    callback.scheduler.cancel(callback.callback)
+                    for callback in observer.update_callbacks or () if isinstance(callback, _Scheduled)
+                ]
+                observer.suspend(stale=any(cancelled))
 
 
 class ComboBox(QComboBox):
@@ -28,14 +277,15 @@ class ComboBox(QComboBox):
             index_changed: Callable[[int], None] = None,
             min_width: int = None,
             max_width: int = None,
-            stretch: int = 0
+            stretch: int = 0,
+            coalesce: Union[bool, UpdateScheduler] = True,
     ):
         super(ComboBox, self).__init__(parent=parent)
         self.addItems(items)
         if isinstance(enabled, Value):
             self.setEnabled(enabled.data)
-            self._enabled_observer = Observer([enabled])
-            self._enabled_observer.on_update(self.setEnabled)
+            self._enabled_observer = bind_observer(self, Observer([enabled]))
+            self._enabled_observer.on_update(_updater(self.setEnabled, coalesce))
         else:
             self.setEnabled(enabled)
 
@@ -59,20 +309,21 @@ class Label(QLabel):
             enabled: Union[Value, bool] = True,
             min_width: int = None,
             max_width: int = None,
-            stretch: int = 0
+            stretch: int = 0,
+            coalesce: Union[bool, UpdateScheduler] = True,
     ):
         super(Label, self).__init__(parent=parent)
         if isinstance(value, Value):
             self.setText(value.data)
-            self._value_observer = Observer([value])
-            self._value_observer.on_update(self.setText)
+            self._value_observer = bind_observer(self, Observer([value]))
+            self._value_observer.on_update(_updater(self.setText, coalesce))
         else:
             self.setText(value)
 
         if isinstance(enabled, Value):
             self.setEnabled(enabled.data)
-            self._enabled_observer = Observer([enabled])
-            self._enabled_observer.on_update(self.setEnabled)
+            self._enabled_observer = bind_observer(self, Observer([enabled]))
+            self._enabled_observer.on_update(_updater(self.setEnabled, coalesce))
         else:
             self.setEnabled(enabled)
 
@@ -95,20 +346,21 @@ class Button(QPushButton):
             min_width: int = None,
             max_width: int = None,
             stretch: int = 0,
+            coalesce: Union[bool, UpdateScheduler] = True,
     ):
         super(Button, self).__init__(parent=parent)
 
         if isinstance(value, Value):
             self.setText(value.data)
-            self._text_observer = Observer([value])
-            self._text_observer.on_update(self.setText)
+            self._text_observer = bind_observer(self, Observer([value]))
+            self._text_observer.on_update(_updater(self.setText, coalesce))
         else:
             self.setText(value)
 
         if isinstance(enabled, Value):
             self.setEnabled(enabled.data)
-            self._enabled_observer = Observer([enabled])
-            self._enabled_observer.on_update(self.setEnabled)
+            self._enabled_observer = bind_observer(self, Observer([enabled]))
+            self._enabled_observer.on_update(_updater(self.setEnabled, coalesce))
         else:
             self.setEnabled(enabled)
 
@@ -133,17 +385,21 @@ class Input(QLineEdit):
             min_width: int = None,
             max_width: int = None,
             stretch: int = 0,
+            debounce: Optional[int] = None,
+            throttle: Optional[int] = None,
+            coalesce: Union[bool, UpdateScheduler] = True,
     ):
         super(Input, self).__init__(parent=parent)
         self.setText(binding.data)
-        self.textEdited.connect(binding.set_data)
-        self._binding_observer = Observer([binding])
-        self._binding_observer.on_update(self.setText)
+        self._binding_sink = _rate_limited(binding.set_data, debounce, throttle)
+        self.textEdited.connect(self._binding_sink)
+        self._binding_observer = bind_observer(self, Observer([binding]))
+        self._binding_observer.on_update(_updater(self._set_text, coalesce))
 
         if isinstance(enabled, Value):
             self.setEnabled(enabled.data)
-            self._enabled_observer = Observer([enabled])
-            self._enabled_observer.on_update(self.setEnabled)
+            self._enabled_observer = bind_observer(self, Observer([enabled]))
+            self._enabled_observer.on_update(_updater(self.setEnabled, coalesce))
         else:
             self.setEnabled(enabled)
 
@@ -155,6 +411,11 @@ class Input(QLineEdit):
 
         self._stretch = stretch
 
+    def _set_text(self, text: str):
+        # Avoid resetting the cursor when the update merely echoes what was typed
+        if self.text() != text:
+            self.setText(text)
+
 
 class MultiLineInput(QPlainTextEdit):
     def __init__(
@@ -165,19 +426,35 @@ class MultiLineInput(QPlainTextEdit):
             min_width: int = None,
             max_width: int = None,
             stretch: int = 0,
+            incremental: bool = False,
+            debounce: Optional[int] = None,
+            throttle: Optional[int] = None,
+            coalesce: Union[bool, UpdateScheduler] = True,
     ):
         super(MultiLineInput, self).__init__(parent=parent)
         self.setPlainText(binding.data)
 
-        def set_data():
-            binding.set_data(self.toPlainText())
-
-        self.textChanged.connect(set_data)
+        if incremental:
+            # Edits are propagated as change records, the text is only copied out of the document when read
+            if not isinstance(binding, TextValue):
+                raise TypeError("An incremental MultiLineInput must be bound to a TextValue")
+            document = self.document()
+            binding.attach(document.toPlainText)
+            document.contentsChange.connect(lambda *change: self._apply_change(binding, *change))
+            # The document outlives the destroyed signal of the widget, so its text can still be taken over.
+            # A binding that is being garbage collected along with the widget has nothing left to take over.
+            binding_ref = weakref.ref(binding)
+            self.destroyed.connect(lambda *_: binding_ref() is not None and binding_ref().detach())
+        else:
+            # Rate limiting also defers copying the document out of the widget
+            sink = _rate_limited(lambda _: binding.set_data(self.toPlainText()), debounce, throttle)
+            self._binding_sink = sink
+            self.textChanged.connect(lambda: sink(None))
 
         if isinstance(enabled, Value):
             self.setEnabled(enabled.data)
-            self._enabled_observer = Observer([enabled])
-            self._enabled_observer.on_update(self.setEnabled)
+            self._enabled_observer = bind_observer(self, Observer([enabled]))
+            self._enabled_observer.on_update(_updater(self.setEnabled, coalesce))
         else:
             self.setEnabled(enabled)
 
@@ -189,6 +466,14 @@ class MultiLineInput(QPlainTextEdit):
 
         self._stretch = stretch
 
+    def _apply_change(self, binding: TextValue, position: int, removed: int, added: int):
+        if removed == 0 and added == 0:
+            return
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(position)
+        cursor.setPosition(min(position + added, self.document().characterCount() - 1), QTextCursor.MoveMode.KeepAnchor)
+        binding.apply_change(position, removed, cursor.selectedText().replace('\u2029', '\n'))
+
 
 class Row(QHBoxLayout):
     def __init__(self, children: List = [], stretch: int = 0):
@@ -201,6 +486,9 @@ class Row(QHBoxLayout):
 
             _stretch = child._stretch if hasattr(child, '_stretch') else _stretch
 
+            if isinstance(child, ForEach):
+                child.setDirection(self.direction())
+
             if isinstance(child, QWidget):
                 self.addWidget(child, _stretch)
             elif isinstance(child, QLayout):
@@ -210,6 +498,16 @@ class Row(QHBoxLayout):
 
         self._stretch = stretch
 
+    def bind(
+            self,
+            source: Union[ValueList, Value],
+            template: Callable[[Value], Union[QWidget, QLayout]],
+            key: Callable = None,
+    ) -> 'Row':
+        """Appends one child per item of ``source`` that follows its changes, see ForEach."""
+        self.addLayout(ForEach(source, template, key, self.direction()))
+        return self
+
 
 class Column(QVBoxLayout):
     def __init__(self, children: List = [], stretch: int = 0):
@@ -222,6 +520,9 @@ class Column(QVBoxLayout):
 
             _stretch = child._stretch if hasattr(child, '_stretch') else _stretch
 
+            if isinstance(child, ForEach):
+                child.setDirection(self.direction())
+
             if isinstance(child, QWidget):
                 self.addWidget(child, _stretch)
             elif isinstance(child, QLayout):
@@ -231,6 +532,102 @@ class Column(QVBoxLayout):
 
         self._stretch = stretch
 
+    def bind(
+            self,
+            source: Union[ValueList, Value],
+            template: Callable[[Value], Union[QWidget, QLayout]],
+            key: Callable = None,
+    ) -> 'Column':
+        """Appends one child per item of ``source`` that follows its changes, see ForEach."""
+        self.addLayout(ForEach(source, template, key, self.direction()))
+        return self
+
+
+class ForEach(QBoxLayout):
+    """
+    Reactive children of a Row or Column: one ``template(item)`` widget (or layout) per item of ``source``, a
+    ValueList or a Value holding a list. On every change, the old and new items are matched by ``key(item)``
+    (default: the item itself): widgets are only built for new keys and deleted for removed keys, and the fewest
+    widgets are moved to restore the order. Kept widgets keep their Observers; their ``item`` Value is set to the new
+    item with that key.
+    """
+    def __init__(
+            self,
+            source: Union[ValueList, Value],
+            template: Callable[[Value], Union[QWidget, QLayout]],
+            key: Callable = None,
+            direction: QBoxLayout.Direction = QBoxLayout.Direction.TopToBottom,
+            stretch: int = 0,
+    ):
+        super(ForEach, self).__init__(direction)
+        self.setContentsMargins(0, 0, 0, 0)
+        self._template = template
+        self._key = key or (lambda item: item)
+        # key -> (item Value, widget), and the keys in layout order
+        self._children = {}
+        self._keys = []
+        self._set_items(_bind_items(self, source))
+        self._stretch = stretch
+
+    def widget_for(self, key) -> Optional[QWidget]:
+        child = self._children.get(key)
+        return child[1] if child is not None else None
+
+    def _set_items(self, items: Sequence):
+        keys = [self._key(item) for item in items]
+        if len(set(keys)) != len(keys):
+            raise ValueError("ForEach keys must be unique")
+        new = set(keys)
+        for key in self._keys:
+            if key not in new:
+                _, widget = self._children.pop(key)
+                self.removeWidget(widget)
+                widget.deleteLater()
+        old = {key: position for position, key in enumerate(key for key in self._keys if key in new)}
+
+        # The kept widgets in the longest run that is already in order stay, all others are taken out and reinserted
+        stable = _longest_increasing([old[key] for key in keys if key in old])
+        for key in old:
+            if old[key] not in stable:
+                self.removeWidget(self._children[key][1])
+        for index, (key, item) in enumerate(zip(keys, items)):
+            child = self._children.get(key)
+            if child is None:
+                value = Value(item, compare='identity')
+                widget = _as_widget(self._template(value))
+                self._children[key] = (value, widget)
+                self.insertWidget(index, widget, getattr(widget, '_stretch', 1))
+                continue
+            value, widget = child
+            if value.data is not item:
+                value.set_data(item)
+            if old[key] not in stable:
+                self.insertWidget(index, widget, getattr(widget, '_stretch', 1))
+        self._keys = keys
+
+
+def _longest_increasing(sequence: List[int]) -> set:
+    """Values of a longest strictly increasing subsequence, in O(n log n)."""
+    tails = []
+    # Index in ``sequence`` of the last value of the best subsequence of every length, and the predecessor of each
+    tail_indices = []
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[length] = value
+            tail_indices[length] = i
+        previous[i] = tail_indices[length - 1] if length else -1
+    result = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i >= 0:
+        result.add(sequence[i])
+        i = previous[i]
+    return result
+
 
 class GridLayout(QGridLayout):
     def __init__(self, children: List = [], stretch: int = 0):
@@ -280,6 +677,102 @@ class Splitter(QSplitter):
         self._stretch = stretch
 
 
+class ListView(QAbstractScrollArea):
+    """
+    Virtualized list: ``template(item)`` builds the widget of a row bound to the Value ``item``, but only as many rows
+    as fit into the viewport are built. While scrolling, rows that leave the viewport are reused for the items that
+    enter it by setting their ``item`` Value. ``source`` is a ValueList, a Value holding a list or a plain sequence.
+    All rows are ``row_height`` pixels high, by default the height of the first row built.
+    """
+    def __init__(
+            self,
+            parent: Optional[QWidget],
+            source: Union[ValueList, Value, Sequence],
+            template: Callable[[Value], Union[QWidget, QLayout]],
+            row_height: int = None,
+            stretch: int = 0,
+    ):
+        super(ListView, self).__init__(parent=parent)
+        self._template = template
+        self._row_height = row_height
+        # Rows are (item Value, widget, bound index); the item at index i is shown by row i % len(rows)
+        self._rows = []
+        self._items = _bind_items(self, source)
+        self.verticalScrollBar().setSingleStep(self._row_height or 20)
+        self._stretch = stretch
+
+    @property
+    def row_count(self) -> int:
+        """Number of row widgets built, which depends on the viewport height only."""
+        return len(self._rows)
+
+    def scroll_to(self, index: int):
+        self.verticalScrollBar().setValue(index * self._height())
+
+    def _set_items(self, items: Sequence):
+        self._items = items
+        self._refresh()
+
+    def _build_row(self, index: int):
+        item = Value(self._items[index], compare='identity')
+        widget = _as_widget(self._template(item))
+        widget.setParent(self.viewport())
+        self._rows.append([item, widget, index])
+        if self._row_height is None:
+            self._row_height = max(widget.sizeHint().height(), 1)
+            self.verticalScrollBar().setSingleStep(self._row_height)
+
+    def _height(self) -> int:
+        if self._row_height is None and self._items:
+            self._build_row(0)
+        return self._row_height or 1
+
+    def _refresh(self):
+        height = self._height()
+        viewport = self.viewport().height()
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setPageStep(viewport)
+        scrollbar.setRange(0, max(len(self._items) * height - viewport, 0))
+        # One extra row covers the partially visible rows at the top and bottom
+        needed = min(viewport // height + 2, len(self._items))
+        while len(self._rows) < needed:
+            self._build_row(len(self._rows))
+        self._layout(rebind=True)
+
+    def _layout(self, rebind: bool = False):
+        if not self._rows:
+            return
+        height = self._row_height
+        offset = self.verticalScrollBar().value()
+        first = offset // height
+        width = self.viewport().width()
+        count = len(self._rows)
+        shown = set()
+        for index in range(first, min(first + count, len(self._items))):
+            row = self._rows[index % count]
+            item, widget, bound = row
+            if rebind or bound != index:
+                item.set_data(self._items[index])
+                row[2] = index
+            widget.setGeometry(0, index * height - offset, width, height)
+            widget.show()
+            shown.add(index % count)
+        for i, (_, widget, _) in enumerate(self._rows):
+            if i not in shown:
+                widget.hide()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        self._layout()
+
+    def resizeEvent(self, event):
+        super(ListView, self).resizeEvent(event)
+        self._refresh()
+
+    def showEvent(self, event):
+        super(ListView, self).showEvent(event)
+        self._refresh()
+
+
 class ViewModel:
     def __setattr__(self, key, value):
         if key in self.__dict__:
@@ -289,6 +782,9 @@ class ViewModel:
         else:
             self.__dict__[key] = Value(value)
 
+    def transaction(self):
+        return Value.batch()
+
 
 class View(QWidget):
     def __init__(self):
@@ -1,146 +1,837 @@
-from typing import List, Union, Set, Tuple
+import asyncio
+import heapq
+import operator
+import threading
+import weakref
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager
+from itertools import count
+from typing import List, Union, Set, Tuple, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Propagation engine: every node has a rank (its height in the dependency graph). Dirty nodes are
+# kept in a heap ordered by (rank, creation id), so a node is only recomputed after all of its
+# publishers settled, exactly once per change and in a deterministic order.
+_ids = count()
+_heap = []
+_pending = {}
+_propagating = False
+
+
+class _ThreadState(threading.local):
+    def __init__(self):
+        # Stack of the batches open in this thread, each journaling the original data of the Values written inside it.
+        # Batches are per thread, so that a batch on a worker thread does not capture writes of the GUI thread.
+        self.journals = []
+        # Values read while a computed Value evaluates in this thread, None outside of evaluations
+        self.tracking = None
+
+
+_state = _ThreadState()
+
+# Writes from threads other than the GUI thread are handed to the dispatcher, see set_dispatcher.
+_dispatcher = None
+_gui_thread = None
+# Optional profiler timing every node update, see pyquantum.profiler.
+_profiler = None
+# Number of computed Values evaluating in any thread, so that reads only look up the tracking of their thread while
+# there can be one.
+_evaluations = 0
+_evaluations_lock = threading.Lock()
+
+
+def set_dispatcher(dispatcher, thread: int = None):
+    """
+    Routes ``set_data`` calls made outside of ``thread`` (default: the calling thread) to ``dispatcher.post(value,
+    data)`` and other writes to ``dispatcher.call(function)``; the dispatcher is responsible for applying them on that
+    thread. Pass ``None`` to apply writes inline again.
+    """
+    global _dispatcher, _gui_thread
+    _dispatcher = dispatcher
+    _gui_thread = threading.get_ident() if thread is None else thread
+
+
+def set_profiler(profiler):
+    """
+    Routes every node update during propagation through ``profiler.record(node, publisher)``, lazy recomputes through
+    ``profiler.compute(node)`` and deferred widget updates through ``profiler.call(callback, args)``; ``None``
+    disables it.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def _foreign_thread() -> bool:
+    return _dispatcher is not None and threading.get_ident() != _gui_thread
+
+
+def _call_in_gui_thread(function, *args):
+    if _foreign_thread():
+        _dispatcher.call(function, *args)
+    else:
+        function(*args)
+
+
+def _schedule(subscribers, publisher):
+    # Unobserved lazy subscribers are only marked stale, together with everything downstream of them
+    stale = []
+    _enqueue(subscribers, publisher, stale)
+    while stale:
+        node = stale.pop()
+        if node._function is not None and not node._dirty:
+            node._dirty = True
+            _enqueue(node.subscribers, node, stale)
+
+
+def _enqueue(subscribers, publisher, stale: list):
+    for sub in subscribers:
+        if sub.lazy and not sub.update_callbacks and not sub.observed:
+            stale.append(sub)
+            continue
+        if sub not in _pending:
+            heapq.heappush(_heap, (sub.rank, sub._id, sub))
+        _pending[sub] = publisher
+
+
+def _propagate():
+    global _propagating
+    if _propagating:
+        return
+    _propagating = True
+    profiler = _profiler if _heap else None
+    if profiler is not None:
+        profiler.begin()
+    try:
+        while _heap:
+            _, _, node = heapq.heappop(_heap)
+            if profiler is None:
+                node._update(_pending.pop(node))
+            else:
+                profiler.record(node, _pending.pop(node))
+    finally:
+        _heap.clear()
+        _pending.clear()
+        _propagating = False
+        if profiler is not None:
+            profiler.end()
+
+
+def _raise_rank(node, rank):
+    stack = [(node, rank)]
+    while stack:
+        node, rank = stack.pop()
+        if node.rank >= rank:
+            continue
+        node.rank = rank
+        for sub in getattr(node, 'subscribers', ()):
+            stack.append((sub, rank + 1))
+
+
+def _call_profiled(callback, *args):
+    if _profiler is None:
+        callback(*args)
+    else:
+        _profiler.call(callback, args)
+
+
+def _call_in_loop(loop, function, *args):
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        function(*args)
+    else:
+        loop.call_soon_threadsafe(function, *args)
+
+
+# Change detection strategies, each telling whether the data of a Value changed from ``a`` to ``b``. Values without
+# a strategy use ``a != b``.
+def _identity_changed(a, b) -> bool:
+    return a is not b
+
+
+class _HashChanged:
+    """Compares ``function(a)`` and ``function(b)``; the digest of the last ``b`` is kept, so it is hashed only once."""
+    __slots__ = ('function', '_last', '_digest')
+
+    def __init__(self, function: Callable = hash):
+        self.function = function
+        self._last = None
+        self._digest = None
+
+    def __call__(self, a, b) -> bool:
+        # Also holds for data mutated in place: the kept digest is the one from before the mutation
+        digest = self._digest if a is self._last and self._last is not None else self.function(a)
+        self._last, self._digest = b, self.function(b)
+        return digest != self._digest
+
+
+def _always_changed(a, b) -> bool:
+    return True
+
+
+_strategies = {
+    'equality': None,
+    'identity': _identity_changed,
+    'hash': _HashChanged,
+    'version': _always_changed,
+}
+
+
+def _strategy(compare):
+    if isinstance(compare, tuple) and len(compare) == 2 and compare[0] == 'hash':
+        return _HashChanged(compare[1])
+    if compare is None or isinstance(compare, str):
+        try:
+            strategy = _strategies[compare or 'equality']
+        except KeyError:
+            raise ValueError(f"compare must be a callable or one of {', '.join(_strategies)}") from None
+        # Hashing keeps the last digest, so every Value needs its own strategy
+        return strategy() if strategy is _HashChanged else strategy
+    return lambda a, b: not compare(a, b)
+
+
+def _rsub(a, b):
+    return b - a
+
+
+def _rtruediv(a, b):
+    return b / a
+
+
+def _invert(x):
+    return (not x) if isinstance(x, bool) else ~x
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _Memoized:
+    """LRU cache of the results of a function of one argument, keyed by the argument or ``key(argument)``."""
+    __slots__ = ('function', 'maxsize', 'key', 'cache', 'hits', 'misses')
+
+    def __init__(self, function: Callable, maxsize: int, key: Optional[Callable] = None):
+        if maxsize < 1:
+            raise ValueError("memoize must be at least 1")
+        self.function = function
+        self.maxsize = maxsize
+        self.key = key
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, data):
+        key = data if self.key is None else self.key(data)
+        try:
+            result = self.cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable inputs are not cached
+            self.misses += 1
+            return self.function(data)
+        else:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self.cache[key] = self.function(data)
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.cache))
+
+    def cache_clear(self):
+        self.cache.clear()
+        self.hits = self.misses = 0
 
 
 class Value:
-    def __init__(self, data, _children=()):
-        self.data = data
-        self.subscribers = set()
-        self.subscriptions = set(_children)
+    # Most nodes are leaves without subscribers or callbacks, so their storage is only allocated on first use.
+    # Publishers are not stored separately: they are the Values among the arguments of the node.
+    __slots__ = (
+        '_data', '_function', '_args', '_dirty', 'lazy', '_subscribers', 'update_callbacks', 'rank', '_id',
+        '_compare', 'version', '__weakref__',
+    )
+
+    def __init__(self, data=None, lazy: bool = False, compare=None, _children=()):
+        """
+        ``compare`` selects how ``set_data`` detects a change: ``'equality'`` (default, ``!=``), ``'identity'``,
+        ``'hash'`` (or ``('hash', function)`` for unhashable data such as lists or arrays; the digest of the current
+        data is kept), ``'version'`` (every write is a change, O(1) for large payloads) or a callable ``equal(a, b)``.
+        ``version`` increases whenever this Value changes; ``touch()`` reports in-place mutations of its data.
+        """
+        self._data = data
+        self._compare = _strategy(compare)
+        self.version = 0
+        self._function = None
+        self._args = tuple(_children)
+        self._dirty = False
+        self.lazy = lazy
+        self._subscribers = None
+        self.update_callbacks = None
+        self.rank = 0
+        self._id = next(_ids)
         for publisher in self.subscriptions:
             publisher.subscribe(self)
-        self.update_callbacks = []
+
+    @property
+    def data(self):
+        if _evaluations and _state.tracking is not None:
+            _state.tracking.append(self)
+        if self._dirty:
+            self._materialize()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._dirty = False
+        self._data = data
+
+    def _materialize(self):
+        # Stale publishers are recomputed first, by rank, so that computing one node never recurses into another
+        nodes, stack = {self}, [self]
+        while stack:
+            for publisher in stack.pop().subscriptions:
+                if publisher._dirty and publisher not in nodes:
+                    nodes.add(publisher)
+                    stack.append(publisher)
+        # Reads made while recomputing are not dependencies of a computed Value reading this one
+        state = _state
+        tracking, state.tracking = state.tracking, None
+        try:
+            for node in sorted(nodes, key=lambda node: node.rank):
+                if node._dirty:
+                    # Only clear the flag once the data is computed, so a failing function is retried on the next read
+                    node._data = node._compute() if _profiler is None else _profiler.compute(node)
+                    node._dirty = False
+        finally:
+            state.tracking = tracking
 
     @property
     def dtype(self):
         return type(self.data)
 
     def set_data(self, data: any):
-        is_different = self.data != data
+        if _foreign_thread():
+            _dispatcher.post(self, data)
+            return
+        # A stale derived Value is compared with its last computed data instead of being recomputed
+        previous = self._data if self._function is not None else self.data
         self.data = data
-        if is_different:
-            self.notify_subscribers()
+        journals = _state.journals
+        if journals:
+            journals[-1].setdefault(self, (previous, self.version))
+        elif previous != data if self._compare is None else self._compare(previous, data):
+            self._changed(previous)
+            _propagate()
+
+    def touch(self):
+        """Notifies subscribers after the data of this Value was mutated in place."""
+        if _foreign_thread():
+            _dispatcher.call(self.touch)
+            return
+        journals = _state.journals
+        if journals:
+            journals[-1].setdefault(self, (self.data, self.version))
+            self.version += 1
+            return
+        self._changed(self.data)
+        _propagate()
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """
+        Defers all notifications until the outermost batch exits, then recomputes and notifies every affected
+        node once with the final values. Batches nest; a batch that raises restores the Values written inside it.
+        """
+        journals = _state.journals
+        journal = {}
+        journals.append(journal)
+        try:
+            yield
+        except BaseException:
+            journals.pop()
+            for node, (data, _) in journal.items():
+                node.data = data
+            raise
+        journals.pop()
+        if journals:
+            for node, entry in journal.items():
+                journals[-1].setdefault(node, entry)
+            return
+        if not journal:
+            # Also the case for batches on other threads, whose writes went to the dispatcher
+            return
+        for node, (data, version) in journal.items():
+            if node.version != version or node._differs(data, node.data):
+                node._changed(data)
+        _propagate()
+
+    @property
+    def subscriptions(self) -> tuple:
+        return tuple(dict.fromkeys(arg for arg in self._args if isinstance(arg, Value)))
+
+    @property
+    def subscribers(self) -> list:
+        if self._subscribers is None:
+            return []
+        subscribers = [ref() for ref in self._subscribers]
+        if None in subscribers:
+            self._prune()
+            subscribers = [sub for sub in subscribers if sub is not None]
+        return subscribers
 
     def subscribe(self, value):
-        self.subscribers.add(value)
+        # Subscribers are only referenced weakly, so derived Values and Observers nobody holds on to are collected.
+        _raise_rank(value, self.rank + 1)
+        if self._dirty and not value.lazy:
+            # Stale Values do not pass on invalidations, so an eager subscriber needs this one up to date
+            self._materialize()
+        if self._subscribers is None:
+            self._subscribers = []
+        self._subscribers.append(weakref.ref(value))
+        size = len(self._subscribers)
+        if size >= 8 and size & (size - 1) == 0:
+            self._prune()
 
     def unsubscribe(self, value):
-        self.subscribers.remove(value)
+        self._subscribers = [ref for ref in self._subscribers if ref() is not value]
+        self._prune()
+
+    def _prune(self):
+        self._subscribers = [ref for ref in self._subscribers if ref() is not None] or None
 
     def notify_subscribers(self):
-        for sub in self.subscribers:
-            sub.value_update(self.data)
+        _schedule(self.subscribers, self)
+        _propagate()
+
+    def _differs(self, previous, data) -> bool:
+        return previous != data if self._compare is None else self._compare(previous, data)
+
+    def _changed(self, previous):
+        self.version += 1
+        _schedule(self.subscribers, self)
 
     def on_update(self, callback):
+        if self.update_callbacks is None:
+            self.update_callbacks = []
         self.update_callbacks.append(callback)
 
     def value_update(self, data):
-        for callback in self.update_callbacks:
+        for callback in self.update_callbacks or ():
             callback(data)
 
-    def __del__(self):
-        for publisher in self.subscriptions:
-            publisher.unsubscribe(self)
+    def _update(self, publisher):
+        if self._function is not None:
+            if not self.lazy or self.observed:
+                self.set_data(self._compute())
+            else:
+                self._invalidate()
+        if self.update_callbacks:
+            self.value_update(publisher.data)
+
+    def _invalidate(self):
+        # Nobody needs the result right now: only remember that it is stale.
+        if self._function is not None and not self._dirty:
+            self._dirty = True
+            _schedule(self.subscribers, self)
 
-    def __repr__(self):
-        return f"Value({self.data}, dtype={self.dtype})"
+    @property
+    def observed(self) -> bool:
+        return any(not sub.lazy for sub in self.subscribers)
 
-    def map(self, function):
-        out = Value(function(self.data), _children=(self,))
+    def _compute(self):
+        return self._function(*[arg.data if isinstance(arg, Value) else arg for arg in self._args])
 
-        def on_update(data):
-            out.set_data(function(self.data))
+    def changed(self) -> asyncio.Future:
+        """
+        Returns a future that resolves with the data of this Value after its next change. Must be called while an
+        asyncio loop is running, i.e. ``data = await value.changed()``.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        observer = Observer([self])
 
-        out.on_update(on_update)
-        return out
+        def resolve(data):
+            if not future.done():
+                future.set_result(data)
 
-    def __generic_operation__(self, other, function):
-        if isinstance(other, Value):
-            out = Value(function(self.data, other.data), _children=(self, other))
+        observer.on_update(lambda data: _call_in_loop(loop, resolve, data))
+        # The future keeps the observer alive until it is done.
+        future.add_done_callback(lambda _, observer=observer: None)
+        return future
 
-            def on_update(data):
-                out.set_data(function(self.data, other.data))
+    def stream(self, maxsize: int = 64) -> 'ValueStream':
+        return ValueStream(self, maxsize)
 
-        else:
-            out = Value(function(self.data, other), _children=(self,))
+    def __aiter__(self) -> 'ValueStream':
+        return self.stream()
 
-            def on_update(data):
-                out.set_data(function(self.data, other))
+    def __repr__(self):
+        return f"Value({self.data}, dtype={self.dtype})"
 
-        out.on_update(on_update)
+    def _derive(self, function, args, lazy=None, compare=None):
+        if lazy is None:
+            lazy = any(arg.lazy for arg in args if isinstance(arg, Value))
+        out = Value(lazy=lazy, compare=compare, _children=args)
+        out._function = function
+        if lazy:
+            out._dirty = True
+        else:
+            out._data = out._compute()
         return out
 
+    def map(self, function, lazy: bool = None, compare=None, memoize: int = None, key: Callable = None):
+        """
+        Derives a Value that holds ``function(self.data)``. A lazy Value (``lazy=True``, by default inherited from its
+        publishers) only marks itself dirty on upstream changes and recomputes when its data is read or observed.
+        ``compare`` selects the change detection of the result, see ``Value``. With ``memoize``, the results for the
+        last ``memoize`` inputs (or ``key(input)``) are cached, see ``cache_info``.
+        """
+        if memoize is not None:
+            function = _Memoized(function, memoize, key)
+        return self._derive(function, (self,), lazy, compare)
+
+    def memo_map(self, function, maxsize: int = 128, key: Callable = None, lazy: bool = None, compare=None):
+        """Shorthand for ``map(function, memoize=maxsize, key=key)``."""
+        return self.map(function, lazy, compare, maxsize, key)
+
+    def cache_info(self) -> Optional['CacheInfo']:
+        """Hits, misses and size of the cache of a Value derived with ``memoize``, None for other Values."""
+        return self._function.cache_info() if isinstance(self._function, _Memoized) else None
+
+    def cache_clear(self):
+        """Empties the cache of a Value derived with ``memoize`` and resets its counters."""
+        if isinstance(self._function, _Memoized):
+            self._function.cache_clear()
+
+    def map_async(self, function, executor: 'Executor' = None, initial=None) -> 'Value':
+        """
+        Derives a Value holding ``function(self.data)`` computed on ``executor`` (default: a shared thread pool),
+        starting out with ``initial``. Only the result for the latest data is taken over; its ``pending`` and
+        ``error`` Values tell whether a call is running and hold the exception of the last call.
+        """
+        from .operators import AsyncValue
+        return AsyncValue(self, function, executor, initial)
+
+    def debounce(self, ms: int) -> 'Value':
+        """Derives a Value that only takes over the data of this Value once it did not change for ``ms`` ms."""
+        from .operators import OperatorValue, Debouncer
+        return OperatorValue(self, lambda sink: Debouncer(ms, sink))
+
+    def throttle(self, ms: int) -> 'Value':
+        """Derives a Value that takes over the data of this Value at most once every ``ms`` ms."""
+        from .operators import OperatorValue, Throttler
+        return OperatorValue(self, lambda sink: Throttler(ms, sink))
+
+    def sample(self, ms: int) -> 'Value':
+        """Derives a Value that takes over the latest data of this Value every ``ms`` ms."""
+        from .operators import OperatorValue, Sampler
+        return OperatorValue(self, lambda sink: Sampler(ms, sink))
+
+    def distinct_until_changed(self, key=None) -> 'Value':
+        """Derives a Value that only takes over data whose ``key`` differs from the one of its current data."""
+        from .operators import OperatorValue, Distinct
+        return OperatorValue(self, lambda sink: Distinct(key or (lambda data: data), sink, self.data))
+
+    def __generic_operation__(self, other, function):
+        return self._derive(function, (self, other))
+
     def __add__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a + b)
+        return self.__generic_operation__(other, operator.add)
 
     def __radd__(self, other):
         return self + other
 
     def __sub__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a - b)
+        return self.__generic_operation__(other, operator.sub)
 
     def __rsub__(self, other):
-        return self.__generic_operation__(other, lambda a, b: b - a)
+        return self.__generic_operation__(other, _rsub)
 
     def __mul__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a * b)
+        return self.__generic_operation__(other, operator.mul)
 
     def __rmul__(self, other):
         return self * other
 
     def __truediv__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a / b)
+        return self.__generic_operation__(other, operator.truediv)
 
     def __rtruediv__(self, other):
-        return self.__generic_operation__(other, lambda a, b: b / a)
+        return self.__generic_operation__(other, _rtruediv)
 
     def __neg__(self):
-        return self.map(lambda x: -x)
+        return self.map(operator.neg)
 
     def __and__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a & b)
+        return self.__generic_operation__(other, operator.and_)
 
     def __rand__(self, other):
         return self & other
 
     def __or__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a | b)
+        return self.__generic_operation__(other, operator.or_)
 
     def __ror__(self, other):
         return self | other
 
     def __lt__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a < b)
+        return self.__generic_operation__(other, operator.lt)
 
     def __le__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a <= b)
+        return self.__generic_operation__(other, operator.le)
 
     def __gt__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a > b)
+        return self.__generic_operation__(other, operator.gt)
 
     def __ge__(self, other):
-        return self.__generic_operation__(other, lambda a, b: a >= b)
+        return self.__generic_operation__(other, operator.ge)
 
     def __invert__(self):
-        return self.map(lambda x: (not x) if isinstance(x, bool) else ~x)
+        return self.map(_invert)
 
     def eq(self, other):
-        return self.__generic_operation__(other, lambda a, b: a == b)
+        return self.__generic_operation__(other, operator.eq)
+
+
+class ComputedValue(Value):
+    """Value computed by a function without arguments, subscribed to the Values it read in its last evaluation."""
+    __slots__ = ()
+
+    def _compute(self):
+        global _evaluations
+        state = _state
+        outer, state.tracking = state.tracking, []
+        with _evaluations_lock:
+            _evaluations += 1
+        try:
+            data = self._function()
+        finally:
+            reads, state.tracking = state.tracking, outer
+            with _evaluations_lock:
+                _evaluations -= 1
+        dependencies = tuple(dict.fromkeys(value for value in reads if value is not self))
+        if dependencies != self._args:
+            previous = set(self._args)
+            for publisher in previous.difference(dependencies):
+                publisher.unsubscribe(self)
+            for publisher in dependencies:
+                if publisher not in previous:
+                    publisher.subscribe(self)
+            self._args = dependencies
+        return data
+
+
+def computed(function: Callable[[], any], lazy: bool = False, compare=None) -> ComputedValue:
+    """
+    Derives a single Value from ``function()``, e.g. ``computed(lambda: (a.data + b.data) * c.data > d.data)``. The
+    Values whose ``data`` is read during an evaluation become its publishers, so it only subscribes to the branches
+    that were actually taken and follows them when they change.
+    """
+    out = ComputedValue(lazy=lazy, compare=compare)
+    out._function = function
+    if lazy:
+        out._dirty = True
+    else:
+        out._data = out._compute()
+    return out
 
 
 class Observer:
+    __slots__ = ('observables', 'update_callbacks', 'rank', '_id', '_versions', '__weakref__')
+    lazy = False
+
     def __init__(self, observables: Union[List[Value], Set[Value], Tuple[Value]]):
         self.observables = observables
+        self.update_callbacks = None
+        self.rank = 0
+        self._id = next(_ids)
+        # Versions of the observables when this Observer was suspended, None while active
+        self._versions = None
         for observable in self.observables:
             observable.subscribe(self)
-        self.update_callbacks = []
+
+    @property
+    def suspended(self) -> bool:
+        return self._versions is not None
+
+    def suspend(self, stale: bool = False):
+        """
+        Stops receiving updates: the Observer unsubscribes, so lazy Values it kept observed are no longer computed.
+        ``resume`` catches up with the observables that changed in the meantime, or with all of them if ``stale``
+        (e.g. because an update it received was dropped).
+        """
+        if self._versions is None:
+            self._versions = [None if stale else observable.version for observable in self.observables]
+            for observable in self.observables:
+                observable.unsubscribe(self)
+
+    def resume(self):
+        if self._versions is None:
+            return
+        versions, self._versions = self._versions, None
+        for observable, version in zip(self.observables, versions):
+            observable.subscribe(self)
+            # Lazy Values may have been recomputed without a new version while nobody observed them
+            if observable.version != version or observable.lazy:
+                self.value_update(observable.data)
 
     def on_update(self, callback):
+        if self.update_callbacks is None:
+            self.update_callbacks = []
         self.update_callbacks.append(callback)
 
     def value_update(self, value):
-        for callback in self.update_callbacks:
+        for callback in self.update_callbacks or ():
             callback(value)
 
-    def __del__(self):
-        for observable in self.observables:
-            observable.unsubscribe(self)
\ No newline at end of file
+    def _update(self, publisher):
+        self.value_update(publisher.data)
+
+
+TextChange = namedtuple('TextChange', ['position', 'removed', 'added'])
+TextChange.__doc__ = """Edit of a TextValue: ``removed`` characters at ``position`` were replaced by ``added``."""
+
+
+class TextValue(Value):
+    """
+    Value holding a (possibly very large) string that is edited through change records instead of being replaced.
+    Edits are forwarded to the ``on_change`` callbacks as they happen, or when the outermost ``Value.batch()``
+    commits; the full string is only materialized when ``data`` is read, either from ``source`` (e.g. the document
+    being edited) or by applying the pending edits.
+    """
+    __slots__ = ('_source', '_edits', '_change_callbacks', '_pending')
+
+    def __init__(self, data: str = '', source: Callable[[], str] = None):
+        super(TextValue, self).__init__(data)
+        self._source = source
+        self._edits = []
+        self._change_callbacks = []
+        # Change records deferred by batches, with the batch depth they were made at
+        self._pending = []
+        self._dirty = source is not None
+
+    @property
+    def data(self) -> str:
+        return Value.data.fget(self)
+
+    @data.setter
+    def data(self, data: str):
+        self._edits.clear()
+        # Records of a batch that is rolled back are dropped along with its edits
+        depth = len(_state.journals)
+        self._pending = [(level, change) for level, change in self._pending if level <= depth]
+        Value.data.fset(self, data)
+
+    def set_data(self, data: str):
+        journals = _state.journals
+        if not journals or _foreign_thread():
+            return super(TextValue, self).set_data(data)
+        previous = self.data
+        super(TextValue, self).set_data(data)
+        self._pending.append((len(journals), TextChange(0, len(previous), data)))
+
+    def on_change(self, callback: Callable[[TextChange], None]):
+        self._change_callbacks.append(callback)
+
+    def attach(self, source: Callable[[], str]):
+        if self._source is not None:
+            raise ValueError("TextValue is already attached to a source")
+        self._source = source
+        self._edits.clear()
+        self._dirty = True
+
+    def detach(self):
+        """Takes over the current text of the source; later edits are applied to the stored text."""
+        if self._source is not None:
+            self._data = self.data
+            self._source = None
+
+    def apply_change(self, position: int, removed: int, added: str):
+        journals = _state.journals
+        if journals:
+            journals[-1].setdefault(self, (self.data, self.version))
+        self.version += 1
+        if self._source is None:
+            self._edits.append((position, removed, added))
+        self._dirty = True
+        change = TextChange(position, removed, added)
+        if journals:
+            self._pending.append((len(journals), change))
+        else:
+            self._emit(change)
+            self.notify_subscribers()
+
+    def _compute(self):
+        if self._source is not None:
+            return self._source()
+        text = self._data
+        for position, removed, added in self._edits:
+            text = text[:position] + added + text[position + removed:]
+        self._edits.clear()
+        return text
+
+    def _changed(self, previous):
+        if self._pending:
+            pending, self._pending = self._pending, []
+            for _, change in pending:
+                self._emit(change)
+        else:
+            self._emit(TextChange(0, len(previous), self.data))
+        super(TextValue, self)._changed(previous)
+
+    def _emit(self, change: TextChange):
+        for callback in self._change_callbacks:
+            callback(change)
+
+
+class ValueStream:
+    """
+    Async iterator over the updates of a Value. At most ``maxsize`` updates are buffered; when a consumer falls
+    behind, the oldest ones are dropped.
+    """
+
+    def __init__(self, value: Value, maxsize: int = 64):
+        self._buffer = deque(maxlen=maxsize)
+        self._waiter = None
+        self._closed = False
+        self._observer = Observer([value])
+        self._observer.on_update(self._push)
+
+    def _push(self, data):
+        self._buffer.append(data)
+        if self._waiter is not None:
+            _call_in_loop(self._waiter.get_loop(), self._wake, self._waiter)
+
+    @staticmethod
+    def _wake(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def close(self):
+        self._closed = True
+        self._observer = None
+        if self._waiter is not None:
+            _call_in_loop(self._waiter.get_loop(), self._wake, self._waiter)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._buffer.popleft()
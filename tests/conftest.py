@@ -0,0 +1,22 @@
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope='session')
+def app() -> QApplication:
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture
+def dispatcher(app):
+    from pyquantum.ui import GuiDispatcher
+    from pyquantum.value import set_dispatcher
+    dispatcher = GuiDispatcher.install()
+    set_dispatcher(dispatcher)
+    yield dispatcher
+    app.processEvents()
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+from pyquantum import aio
+from pyquantum.value import Value
+
+
+def test_changed_resolves_with_the_next_data(app):
+    value = Value(0)
+
+    async def main():
+        future = value.changed()
+        asyncio.get_running_loop().call_soon(value.set_data, 1)
+        return await asyncio.wait_for(future, 1)
+
+    assert aio.run(main(), app) == 1
+
+
+def test_changed_of_a_stale_lazy_value_resolves(app):
+    source = Value(0)
+    lazy = source.map(lambda x: x * 2, lazy=True)
+    source.set_data(1)
+
+    async def main():
+        future = lazy.changed()
+        asyncio.get_running_loop().call_soon(source.set_data, 2)
+        return await asyncio.wait_for(future, 1)
+
+    assert aio.run(main(), app) == 4
+
+
+def test_stream_drops_the_oldest_updates(app):
+    value = Value(0)
+
+    async def main():
+        stream = value.stream(maxsize=3)
+        for i in range(1, 6):
+            value.set_data(i)
+        stream.close()
+        return [data async for data in stream]
+
+    assert aio.run(main(), app) == [3, 4, 5]
+
+
+def test_stream_wakes_up_on_worker_writes(app, dispatcher):
+    value = Value(0)
+    threads = []
+
+    def worker():
+        for i in range(1, 4):
+            value.set_data(i)
+            threading.Event().wait(0.01)
+
+    async def main():
+        received = []
+        async for data in value.stream():
+            threads.append(threading.current_thread().name)
+            received.append(data)
+            if data == 3:
+                return received
+
+    async def start():
+        task = asyncio.ensure_future(main())
+        # Let the stream subscribe before the worker writes
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            return await asyncio.wait_for(task, 2)
+        finally:
+            thread.join()
+
+    assert aio.run(start(), app)[-1] == 3
+    assert set(threads) == {'MainThread'}
+
+
+def test_run_keeps_qt_events_flowing(app):
+    from PyQt6.QtCore import QTimer
+    fired = []
+
+    async def main():
+        QTimer.singleShot(10, lambda: fired.append(True))
+        await asyncio.sleep(0.1)
+        return fired
+
+    assert aio.run(main(), app) == [True]
@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+
+from pyquantum.array import ArrayValue, SeriesValue
+from pyquantum.value import Value, Observer
+
+
+class Seen(list):
+    """Data passed to an Observer, which the list keeps alive."""
+    observer = None
+
+
+def watch(value: Value) -> Seen:
+    seen = Seen()
+    seen.observer = Observer([value])
+    seen.observer.on_update(lambda data: seen.append(np.copy(data)))
+    return seen
+
+
+def test_elementwise_results_are_recomputed_in_place():
+    a = ArrayValue(np.arange(4.0))
+    doubled = a * 2
+    negated = -doubled
+    buffers = doubled.data, negated.data
+
+    a.write(0, 10.0)
+    a.set_data(np.ones(4))
+
+    assert isinstance(doubled, ArrayValue) and isinstance(negated, ArrayValue)
+    assert doubled.data is buffers[0] and negated.data is buffers[1]
+    np.testing.assert_array_equal(negated.data, -2 * np.ones(4))
+
+
+def test_set_data_copies_into_the_buffer_when_it_fits():
+    a = ArrayValue(np.zeros(3))
+    buffer = a.data
+
+    a.set_data([1, 2, 3])
+    assert a.data is buffer
+    a.set_data(np.zeros(5))
+    assert a.data is not buffer and a.data.shape == (5,)
+
+
+def test_views_are_only_notified_of_overlapping_writes():
+    a = ArrayValue(np.zeros(10))
+    head, tail = a[:5], a[5:]
+    seen_head, seen_tail = watch(head), watch(tail)
+
+    a.write(slice(6, 8), 1.0)
+    assert len(seen_head) == 0 and len(seen_tail) == 1
+    a.write(2, 3.0)
+    assert len(seen_head) == 1 and len(seen_tail) == 1
+    np.testing.assert_array_equal(seen_tail[0], [0, 1, 1, 0, 0])
+    assert head.data[2] == 3.0
+
+    a.set_data(np.ones(10))
+    assert len(seen_head) == 2 and len(seen_tail) == 2
+
+
+def test_writes_in_a_batch_notify_every_view():
+    a = ArrayValue(np.zeros(4))
+    head, tail = a[:2], a[2:]
+    seen_head, seen_tail = watch(head), watch(tail)
+
+    with Value.batch():
+        a.write(0, 1.0)
+
+    assert len(seen_head) == 1 and len(seen_tail) == 1
+
+
+def test_reductions_follow_writes_and_stop_on_unchanged_results():
+    a = ArrayValue(np.array([1.0, 2.0, 3.0]))
+    total, mean, low, high = a.sum(), a.mean(), a.min(), a.max()
+    seen = watch(total)
+
+    a.write(0, 4.0)
+    assert (total.data, mean.data, low.data, high.data) == (9.0, 3.0, 2.0, 4.0)
+    a.write(slice(0, 2), [2.0, 4.0])
+    assert total.data == 9.0
+    assert seen == [9.0]
+
+
+@pytest.mark.parametrize('derive', [
+    lambda a: a.map(lambda x: x * 2),
+    lambda a: a.map(np.cumsum),
+    lambda a: Value(1.0) + a,
+    lambda a: Value(1.0) - a,
+    lambda a: Value(2.0) * a,
+    lambda a: Value(1.0) < a,
+])
+def test_derived_values_follow_writes(derive):
+    a = ArrayValue(np.arange(3.0))
+    derived = derive(a)
+    seen = watch(derived)
+    expected = derive(ArrayValue(np.array([0.0, 5.0, 2.0])))
+
+    a.write(1, 5.0)
+
+    assert len(seen) == 1
+    np.testing.assert_array_equal(derived.data, expected.data)
+
+
+def test_series_keeps_the_latest_samples_across_wraparounds():
+    series = SeriesValue(5)
+    expected = []
+    rng = np.random.default_rng(0)
+    for step in range(200):
+        if rng.random() < 0.5:
+            series.append(float(step))
+            expected.append(float(step))
+        else:
+            samples = np.arange(rng.integers(0, 12)) + step * 100.0
+            series.extend(samples)
+            expected.extend(samples)
+        np.testing.assert_array_equal(series.data, expected[-5:])
+        assert series.total == len(expected) and series.count == min(len(expected), 5)
+
+
+def test_series_window_is_a_read_only_view_of_the_last_samples():
+    series = SeriesValue(4)
+    series.extend([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    window = series.window(3)
+
+    np.testing.assert_array_equal(window, [4.0, 5.0, 6.0])
+    np.testing.assert_array_equal(series.window(10), [3.0, 4.0, 5.0, 6.0])
+    assert len(series.window(0)) == 0
+    assert np.shares_memory(window, series._buffer) and not window.flags.writeable
+
+
+def test_series_set_data_replaces_the_samples():
+    series = SeriesValue(3)
+    series.extend([1.0, 2.0, 3.0, 4.0])
+    seen = watch(series)
+
+    series.set_data([7.0, 8.0])
+
+    np.testing.assert_array_equal(series.data, [7.0, 8.0])
+    assert series.resets == 1 and len(seen) == 1
+    series.clear()
+    assert len(series.data) == 0
+
+
+def test_series_appends_in_a_batch_notify_once():
+    series = SeriesValue(3)
+    seen = watch(series)
+
+    with Value.batch():
+        for sample in range(10):
+            series.append(sample)
+
+    np.testing.assert_array_equal(series.data, [7.0, 8.0, 9.0])
+    assert len(seen) == 1
+
+
+def test_series_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        SeriesValue(0)
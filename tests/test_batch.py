@@ -0,0 +1,97 @@
+import pytest
+
+from pyquantum.value import Value, Observer
+
+
+class Seen(list):
+    """Data passed to an Observer, which the list keeps alive."""
+    observer = None
+
+
+def watch(value: Value) -> Seen:
+    seen = Seen()
+    seen.observer = Observer([value])
+    seen.observer.on_update(seen.append)
+    return seen
+
+
+def test_batch_recomputes_every_node_once_with_final_values():
+    a, b = Value(1), Value(2)
+    calls = []
+    total = a._derive(lambda x, y: calls.append((x, y)) or x + y, (a, b))
+    seen = watch(total)
+    calls.clear()
+
+    with Value.batch():
+        a.set_data(10)
+        b.set_data(20)
+        a.set_data(100)
+        assert seen == []
+
+    assert calls == [(100, 20)]
+    assert seen == [120]
+
+
+def test_nested_batches_notify_when_the_outermost_exits():
+    a, b = Value(1), Value(2)
+    total = a + b
+    seen = watch(total)
+
+    with Value.batch():
+        a.set_data(10)
+        with Value.batch():
+            b.set_data(20)
+        assert seen == [] and total.data == 3
+    assert seen == [30]
+
+
+def test_failing_inner_batch_is_rolled_back_and_the_outer_batch_continues():
+    a, b = Value(1), Value(2)
+    total = a + b
+    seen = watch(total)
+
+    with Value.batch():
+        a.set_data(10)
+        with pytest.raises(RuntimeError):
+            with Value.batch():
+                a.set_data(50)
+                b.set_data(20)
+                raise RuntimeError
+        assert a.data == 10 and b.data == 2
+    assert seen == [12]
+
+
+def test_failing_batch_restores_written_values_without_notifying():
+    a = Value(1)
+    seen = watch(a + 1)
+
+    with pytest.raises(RuntimeError):
+        with Value.batch():
+            a.set_data(5)
+            raise RuntimeError
+    assert a.data == 1
+    assert seen == []
+
+
+def test_batch_that_restores_the_initial_data_does_not_notify():
+    a = Value(1)
+    seen = watch(a)
+
+    with Value.batch():
+        a.set_data(2)
+        a.set_data(1)
+    assert seen == []
+
+
+def test_touch_in_batch_notifies_once_on_commit():
+    items = Value([1], compare='version')
+    length = items.map(len)
+    seen = watch(length)
+
+    with Value.batch():
+        items.data.append(2)
+        items.touch()
+        items.data.append(3)
+        items.touch()
+        assert seen == []
+    assert seen == [3]
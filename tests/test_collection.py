@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from pyquantum.collection import ValueList, _Flags
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Small blocks make splices overflow, empty and span blocks
+    monkeypatch.setattr(_Flags, 'BLOCK', 4)
+
+
+def test_flags_match_a_list(small_blocks):
+    rng = random.Random(0)
+    expected = [rng.random() < 0.5 for _ in range(50)]
+    flags = _Flags(expected)
+    for _ in range(3000):
+        n = len(expected)
+        op = rng.choice(['insert', 'delete', 'set'])
+        if op == 'insert':
+            index = rng.randint(0, n)
+            new = [rng.random() < 0.5 for _ in range(rng.choice([0, 1, 3, 9]))]
+            expected[index:index] = new
+            flags.insert(index, new)
+        elif op == 'delete' and n:
+            start = rng.randrange(n)
+            stop = min(n, start + rng.choice([1, 3, 9]))
+            del expected[start:stop]
+            flags.delete(start, stop)
+        elif op == 'set' and n:
+            index = rng.randrange(n)
+            expected[index] = not expected[index]
+            flags[index] = expected[index]
+        index = rng.randint(0, len(expected))
+        assert len(flags) == len(expected)
+        assert flags.count(index) == expected[:index].count(True)
+        assert flags.slice(index // 2, index) == expected[index // 2:index]
+    assert flags.tolist() == expected
+
+
+def test_filtered_list_follows_its_source(small_blocks):
+    rng = random.Random(1)
+    source = ValueList(rng.randint(0, 50) for _ in range(30))
+    even = source.filter(lambda x: x % 2 == 0)
+    for _ in range(2000):
+        n = len(source)
+        op = rng.choice(['insert', 'pop', 'set', 'slice', 'move', 'reset'])
+        if op == 'insert':
+            source.insert(rng.randint(0, n), rng.randint(0, 50))
+        elif op == 'pop' and n:
+            source.pop(rng.randrange(n))
+        elif op == 'set' and n:
+            source[rng.randrange(n)] = rng.randint(0, 50)
+        elif op == 'slice' and n:
+            start = rng.randrange(n)
+            stop = rng.randint(start, n)
+            source[start:stop] = [rng.randint(0, 50) for _ in range(rng.randint(0, 6))]
+        elif op == 'move' and n:
+            start = rng.randrange(n)
+            stop = rng.randint(start, n)
+            source.move(start, stop, rng.randint(0, n - (stop - start)))
+        elif op == 'reset' and rng.random() < 0.05:
+            source.set_data(rng.randint(0, 50) for _ in range(rng.randint(0, 40)))
+        assert list(even) == [x for x in source if x % 2 == 0]
@@ -0,0 +1,124 @@
+import pytest
+
+from pyquantum.value import Value, Observer
+
+
+class Seen(list):
+    """Data passed to an Observer, which the list keeps alive."""
+    observer = None
+
+
+def watch(value: Value) -> Seen:
+    seen = Seen()
+    seen.observer = Observer([value])
+    seen.observer.on_update(seen.append)
+    return seen
+
+
+def test_equality_ignores_equal_data():
+    value = Value([1])
+    seen = watch(value)
+
+    value.set_data([1])
+    value.set_data([2])
+
+    assert seen == [[2]]
+
+
+def test_identity_notifies_equal_but_new_data():
+    data = [1]
+    value = Value(data, compare='identity')
+    seen = watch(value)
+
+    value.set_data(data)
+    value.set_data([1])
+
+    assert len(seen) == 1
+
+
+def test_hash_compares_digests():
+    calls = []
+
+    def digest(data):
+        calls.append(data)
+        return hash(tuple(data))
+
+    value = Value([1, 2], compare=('hash', digest))
+    seen = watch(value)
+
+    value.set_data([1, 2])
+    value.set_data([3])
+    calls.clear()
+    value.set_data([4])
+
+    assert seen == [[3], [4]]
+    # The digest of the previous data was kept
+    assert calls == [[4]]
+
+
+def test_hash_detects_in_place_mutations():
+    data = [1]
+    value = Value(data, compare=('hash', lambda data: hash(tuple(data))))
+    seen = watch(value)
+
+    value.set_data(data)
+    data.append(2)
+    value.set_data(data)
+
+    assert seen == [[1, 2]]
+
+
+def test_hash_of_hashable_data():
+    value = Value((1, 2), compare='hash')
+    seen = watch(value)
+
+    value.set_data((1, 2))
+    value.set_data((2,))
+
+    assert seen == [(2,)]
+
+
+def test_hash_without_a_function_rejects_unhashable_data():
+    value = Value([1], compare='hash')
+
+    with pytest.raises(TypeError):
+        value.set_data([2])
+
+
+def test_version_notifies_every_write():
+    value = Value(1, compare='version')
+    seen = watch(value)
+
+    value.set_data(1)
+    value.set_data(1)
+
+    assert seen == [1, 1]
+
+
+def test_callable_compares_with_equal():
+    value = Value(1.0, compare=lambda a, b: abs(a - b) < 0.1)
+    seen = watch(value)
+
+    value.set_data(1.05)
+    value.set_data(2.0)
+
+    assert seen == [2.0]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        Value(compare='deep')
+
+
+def test_touch_notifies_in_place_mutations():
+    data = [1]
+    value = Value(data, compare='version')
+    length = value.map(len)
+    seen = watch(length)
+    version = value.version
+
+    data.append(2)
+    value.touch()
+
+    assert value.version == version + 1
+    assert seen == [2]
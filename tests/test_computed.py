@@ -0,0 +1,71 @@
+import threading
+
+from pyquantum.value import Value, Observer, computed
+
+
+def test_dependencies_follow_the_branch_taken():
+    select, a, b = Value(True), Value(1), Value(2)
+    calls = []
+    chosen = computed(lambda: calls.append(None) or (a.data if select.data else b.data))
+    assert set(chosen.subscriptions) == {select, a}
+
+    select.set_data(False)
+    assert chosen.data == 2
+    assert set(chosen.subscriptions) == {select, b}
+    assert chosen not in a.subscribers
+
+    calls.clear()
+    a.set_data(10)
+    assert calls == []
+    b.set_data(20)
+    assert chosen.data == 20 and len(calls) == 1
+
+
+def test_switching_back_resubscribes():
+    select, a, b = Value(True), Value(1), Value(2)
+    chosen = computed(lambda: a.data if select.data else b.data)
+    seen = []
+    observer = Observer([chosen])
+    observer.on_update(seen.append)
+
+    select.set_data(False)
+    select.set_data(True)
+    a.set_data(5)
+
+    assert seen == [2, 1, 5]
+    assert set(chosen.subscriptions) == {select, a}
+
+
+def test_reads_of_a_stale_lazy_value_are_not_dependencies():
+    source = Value(1)
+    lazy = source.map(lambda x: x * 2, lazy=True)
+    source.set_data(2)
+
+    total = computed(lambda: lazy.data + 1)
+
+    assert total.data == 5
+    assert total.subscriptions == (lazy,)
+    source.set_data(3)
+    assert total.data == 7
+
+
+def test_reads_of_other_threads_are_not_dependencies():
+    a, other = Value(1), Value(2)
+    inside, release = threading.Event(), threading.Event()
+
+    def worker():
+        inside.wait()
+        other.data
+        release.set()
+
+    def evaluate():
+        inside.set()
+        release.wait(1)
+        return a.data
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    value = computed(evaluate)
+    thread.join()
+
+    assert value.subscriptions == (a,)
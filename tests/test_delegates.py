@@ -0,0 +1,36 @@
+from PyQt6.QtCore import QModelIndex, QStringListModel
+from PyQt6.QtWidgets import QLineEdit, QWidget
+
+from pyquantum.delegates import ComboBoxDelegate, PooledDelegate
+
+
+def test_pooled_delegate_reuses_closed_editors(app):
+    parent = QWidget()
+    created = []
+    delegate = PooledDelegate(lambda parent: created.append(QLineEdit(parent)) or created[-1])
+
+    editor = delegate.createEditor(parent, None, QModelIndex())
+    delegate.destroyEditor(editor, QModelIndex())
+
+    assert delegate.createEditor(parent, None, QModelIndex()) is editor
+    assert len(created) == 1
+
+
+def test_pooled_combo_box_forgets_the_matches_of_its_previous_edit(app):
+    parent = QWidget()
+    items = [f"item {i}" for i in range(20)]
+    delegate = ComboBoxDelegate(items, filter_threshold=10)
+    model = QStringListModel(['item 3'])
+    index = model.index(0)
+
+    editor = delegate.createEditor(parent, None, index)
+    delegate.setEditorData(editor, index)
+    editor.lineEdit().textEdited.emit('item 1')
+    assert editor.completer().model().stringList()
+    delegate.destroyEditor(editor, index)
+
+    reused = delegate.createEditor(parent, None, index)
+    delegate.setEditorData(reused, index)
+    assert reused is editor
+    assert reused.currentText() == 'item 3'
+    assert reused.completer().model().stringList() == []
@@ -0,0 +1,66 @@
+import pytest
+
+from pyquantum.value import Value, Observer
+
+
+def test_unobserved_lazy_value_is_not_recomputed():
+    calls = []
+    source = Value(1)
+    lazy = source.map(lambda x: calls.append(x) or x * 2, lazy=True)
+
+    source.set_data(2)
+    source.set_data(3)
+
+    assert calls == []
+    assert lazy.data == 6
+    assert calls == [3]
+
+
+def test_observer_attached_to_stale_lazy_value_is_notified():
+    source = Value(1)
+    lazy = source.map(lambda x: x * 10, lazy=True)
+    source.set_data(2)
+    seen = []
+    observer = Observer([lazy])
+    observer.on_update(seen.append)
+
+    source.set_data(3)
+
+    assert seen == [30]
+
+
+def test_observer_attached_to_stale_lazy_chain_is_notified():
+    source = Value(1)
+    tail = source.map(lambda x: x + 1, lazy=True).map(lambda x: x * 2)
+    source.set_data(2)
+    seen = []
+    observer = Observer([tail])
+    observer.on_update(seen.append)
+
+    source.set_data(3)
+
+    assert seen == [8]
+
+
+def test_deep_lazy_chain_does_not_recurse():
+    source = Value(0)
+    node = source
+    for _ in range(3000):
+        node = node.map(lambda x: x + 1, lazy=True)
+
+    source.set_data(1)
+    assert node.data == 3001
+    source.set_data(2)
+    assert node.data == 3002
+
+
+def test_failing_lazy_value_is_recomputed_on_the_next_read():
+    source = Value(1)
+    inverse = source.map(lambda x: 1 / x, lazy=True)
+    source.set_data(0)
+
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            inverse.data
+    source.set_data(4)
+    assert inverse.data == 0.25
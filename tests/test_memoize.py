@@ -0,0 +1,88 @@
+import pytest
+
+from pyquantum.value import Value, CacheInfo
+
+
+def counting(calls: list, function):
+    def wrapper(data):
+        calls.append(data)
+        return function(data)
+    return wrapper
+
+
+def test_repeated_inputs_are_served_from_the_cache():
+    calls = []
+    source = Value(1)
+    squared = source.map(counting(calls, lambda x: x * x), memoize=4)
+
+    for data in [2, 1, 2, 3]:
+        source.set_data(data)
+
+    assert squared.data == 9
+    assert calls == [1, 2, 3]
+    assert squared.cache_info() == CacheInfo(hits=2, misses=3, maxsize=4, currsize=3)
+
+
+def test_least_recently_used_input_is_evicted():
+    calls = []
+    source = Value(1)
+    squared = source.memo_map(counting(calls, lambda x: x * x), maxsize=2)
+
+    source.set_data(2)
+    # Using 1 again makes 2 the least recently used input
+    source.set_data(1)
+    source.set_data(3)
+    calls.clear()
+    source.set_data(1)
+    source.set_data(2)
+
+    assert calls == [2]
+    assert squared.cache_info().currsize == 2
+
+
+def test_key_function_selects_the_cache_entry():
+    calls = []
+    source = Value({'id': 1, 'noise': 0})
+    name = source.map(counting(calls, lambda data: f"item {data['id']}"), memoize=8, key=lambda data: data['id'])
+
+    source.set_data({'id': 1, 'noise': 1})
+    source.set_data({'id': 2, 'noise': 2})
+
+    assert name.data == 'item 2'
+    assert len(calls) == 2
+
+
+def test_unhashable_inputs_bypass_the_cache():
+    calls = []
+    source = Value([1])
+    total = source.map(counting(calls, sum), memoize=4)
+
+    source.set_data([1, 2])
+    source.set_data([1])
+
+    assert total.data == 1
+    assert len(calls) == 3
+    assert total.cache_info() == CacheInfo(hits=0, misses=3, maxsize=4, currsize=0)
+
+
+def test_cache_clear_resets_entries_and_counters():
+    calls = []
+    source = Value(1)
+    squared = source.map(counting(calls, lambda x: x * x), memoize=4)
+    source.set_data(2)
+    source.set_data(1)
+
+    squared.cache_clear()
+    source.set_data(2)
+
+    assert squared.cache_info() == CacheInfo(hits=0, misses=1, maxsize=4, currsize=1)
+    assert calls == [1, 2, 2]
+
+
+def test_cache_info_of_values_without_memoize_is_none():
+    assert Value(1).map(str).cache_info() is None
+
+
+def test_memoize_must_be_positive():
+    with pytest.raises(ValueError):
+        Value(1).map(str, memoize=0)
@@ -0,0 +1,35 @@
+import gc
+import tracemalloc
+
+from pyquantum.value import Value, Observer
+
+
+def test_dropped_derived_values_are_released():
+    source = Value(0)
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for i in range(100_000):
+            source + i
+        baseline = tracemalloc.get_traced_memory()[0]
+        for i in range(1_000_000):
+            source + i
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    # Without the garbage collector, only reference counting can have released the nodes
+    assert growth < 64 * 1024
+    assert len(source._subscribers or ()) < 64
+
+
+def test_dropped_observers_are_released():
+    source = Value(0)
+    gc.disable()
+    try:
+        for _ in range(10_000):
+            Observer([source]).on_update(lambda data: None)
+        source.set_data(1)
+    finally:
+        gc.enable()
+    assert source.subscribers == []
@@ -0,0 +1,91 @@
+import json
+
+from pyquantum.profiler import Profiler
+from pyquantum.ui import UpdateScheduler
+from pyquantum.value import Value, Observer
+
+
+def slow_double(x):
+    return x * 2
+
+
+def test_propagation_updates_are_recorded():
+    source = Value(1)
+    doubled = source.map(slow_double)
+    observer = Observer([doubled])
+    observer.on_update(lambda data: None)
+
+    with Profiler() as profiler:
+        source.set_data(2)
+        source.set_data(3)
+
+    stats = {node.label: node for node in profiler.stats}
+    label = next(label for label in stats if label.endswith('slow_double'))
+    assert stats[label].count == 2
+    assert stats[label].depth == 1
+    assert profiler.cascades == 2
+
+
+def test_lazy_recomputes_on_read_are_recorded():
+    source = Value(1)
+    lazy = source.map(slow_double, lazy=True)
+    source.set_data(2)
+
+    with Profiler() as profiler:
+        assert lazy.data == 4
+
+    [stats] = profiler.stats
+    assert stats.label.endswith('slow_double')
+    assert stats.sources == {'read': 1}
+
+
+def test_scheduled_widget_updates_are_recorded(app):
+    scheduler = UpdateScheduler()
+    received = []
+
+    def set_text(text):
+        received.append(text)
+
+    scheduler.schedule(set_text, 'a')
+    scheduler.schedule(set_text, 'b')
+    with Profiler() as profiler:
+        scheduler.flush()
+
+    assert received == ['b']
+    [stats] = profiler.stats
+    assert stats.label.endswith('set_text')
+    assert stats.count == 1 and stats.sources == {'scheduler': 1}
+
+
+def test_summary_and_chrome_trace(tmp_path):
+    source = Value(1)
+    doubled = source.map(slow_double)
+
+    with Profiler() as profiler:
+        source.set_data(2)
+
+    lines = profiler.summary().splitlines()
+    assert lines[0].startswith('1 propagations, 1 updates')
+    assert 'slow_double' in lines[2]
+
+    path = tmp_path / 'trace.json'
+    profiler.export_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+    events = {event['cat']: event for event in trace['traceEvents']}
+    assert set(events) == {'value', 'cascade'}
+    assert events['value']['ph'] == 'X'
+    assert events['value']['args'] == {'depth': 1, 'source': events['cascade']['args']['source']}
+    assert events['cascade']['args']['nodes'] == 1
+    assert doubled.data == 4
+
+
+def test_stopped_profiler_records_nothing():
+    source = Value(1)
+    doubled = source.map(slow_double)
+    profiler = Profiler()
+    profiler.start()
+    profiler.stop()
+
+    source.set_data(2)
+
+    assert profiler.stats == [] and profiler.cascades == 0
@@ -0,0 +1,82 @@
+from pyquantum.value import Value, Observer, computed
+
+
+def counted(calls: dict, name: str, function):
+    def wrapper(*args):
+        calls[name] = calls.get(name, 0) + 1
+        return function(*args)
+    return wrapper
+
+
+def test_diamond_recomputes_every_node_once():
+    calls = {}
+    a = Value(1)
+    b = a.map(counted(calls, 'b', lambda x: x + 1))
+    c = a.map(counted(calls, 'c', lambda x: x * 2))
+    d = b._derive(counted(calls, 'd', lambda x, y: x + y), (b, c))
+    seen = []
+    observer = Observer([d])
+    observer.on_update(seen.append)
+    calls.clear()
+
+    a.set_data(2)
+
+    assert calls == {'b': 1, 'c': 1, 'd': 1}
+    assert d.data == 7
+    # The observer only sees the settled result, never a glitch with one updated branch
+    assert seen == [7]
+
+
+def test_lattice_recomputes_every_node_once():
+    calls = {}
+    width, depth = 5, 6
+    source = Value(0)
+    layer = [source.map(counted(calls, (0, i), lambda x, i=i: x + i)) for i in range(width)]
+    for level in range(1, depth):
+        layer = [
+            layer[i]._derive(
+                counted(calls, (level, i), lambda x, y: x + y), (layer[i], layer[(i + 1) % width])
+            )
+            for i in range(width)
+        ]
+    sink = layer[0]._derive(counted(calls, 'sink', lambda *xs: sum(xs)), tuple(layer))
+    seen = []
+    observer = Observer([sink])
+    observer.on_update(seen.append)
+    calls.clear()
+
+    source.set_data(1)
+
+    assert set(calls.values()) == {1}
+    assert len(calls) == width * depth + 1
+    assert len(seen) == 1 and seen[0] == sink.data
+
+
+def test_unchanged_result_stops_propagation():
+    calls = {}
+    a = Value(1)
+    parity = a.map(lambda x: x % 2)
+    downstream = parity.map(counted(calls, 'downstream', lambda x: x))
+    calls.clear()
+
+    a.set_data(3)
+
+    assert calls == {}
+    assert downstream.data == 1
+
+
+def test_rank_is_raised_without_recursion_limit():
+    select, a = Value(False), Value(0)
+    deep = a
+    for _ in range(3000):
+        deep = deep + 1
+    switched = computed(lambda: deep.data if select.data else a.data)
+    chain = switched
+    for _ in range(3000):
+        chain = chain + 1
+
+    select.set_data(True)
+    a.set_data(1)
+
+    assert chain.data == 6001
+    assert chain.rank > deep.rank
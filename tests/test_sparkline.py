@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from PyQt6 import sip
+
+from pyquantum.array import SeriesValue
+from pyquantum.sparkline import Sparkline
+
+
+@pytest.fixture
+def make_sparkline(app):
+    """Shown sparklines of a fixed size, deleted again once the test ends."""
+    created = []
+
+    def make(series: SeriesValue, width: int, height: int, **kwargs) -> Sparkline:
+        sparkline = Sparkline(None, series, coalesce=False, **kwargs)
+        sparkline.resize(width, height)
+        sparkline.show()
+        app.processEvents()
+        created.append(sparkline)
+        return sparkline
+
+    yield make
+    for sparkline in created:
+        sip.delete(sparkline)
+
+
+def expected_columns(samples: np.ndarray, spp: int, width: int):
+    """Minimum and maximum of every pixel column, computed from all samples at once."""
+    last = (len(samples) - 1) // spp
+    mins, maxs = np.full(width, np.nan), np.full(width, np.nan)
+    for x, column in enumerate(range(last - width + 1, last + 1)):
+        if column >= 0:
+            chunk = samples[column * spp:(column + 1) * spp]
+            mins[x], maxs[x] = chunk.min(), chunk.max()
+    return mins, maxs
+
+
+def test_incremental_columns_match_a_full_reduction(app, make_sparkline):
+    series = SeriesValue(10_000)
+    sparkline = make_sparkline(series, 100, 30, window=1000)
+    assert sparkline._spp == 10
+
+    samples = np.random.default_rng(1).normal(size=3000)
+    # Blocks of 7 samples start and end in the middle of columns
+    for start in range(0, len(samples), 7):
+        series.extend(samples[start:start + 7])
+        if start % 700 == 0:
+            app.processEvents()
+        mins, maxs = expected_columns(samples[:start + 7], 10, 100)
+        np.testing.assert_array_equal(sparkline._mins, mins)
+        np.testing.assert_array_equal(sparkline._maxs, maxs)
+
+
+def test_reset_series_restarts_the_columns(make_sparkline):
+    series = SeriesValue(100)
+    sparkline = make_sparkline(series, 50, 20)
+    series.extend(np.arange(100.0))
+
+    series.set_data([5.0, 6.0])
+
+    assert np.nanmin(sparkline._mins) == 5.0 and np.nanmax(sparkline._maxs) == 6.0
+    assert np.count_nonzero(~np.isnan(sparkline._maxs)) == 1
+
+
+def test_fixed_range_and_followed_range(make_sparkline):
+    series = SeriesValue(100)
+    fixed = make_sparkline(series, 50, 20, y_range=(-1.0, 1.0))
+    followed = make_sparkline(series, 50, 20)
+
+    series.extend([0.0, 10.0])
+    followed.grab()
+
+    assert fixed._y_range() == (-1.0, 1.0)
+    low, high = followed._range
+    assert low < 0.0 and high > 10.0
+
+
+def test_ui_does_not_import_numpy():
+    code = 'import sys, pyquantum.ui; sys.exit("numpy" in sys.modules)'
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
@@ -0,0 +1,107 @@
+import pytest
+from PyQt6 import sip
+from PyQt6.QtGui import QTextCursor
+
+from pyquantum.ui import MultiLineInput
+from pyquantum.value import TextValue, TextChange, Value
+
+
+def recorded(text: TextValue) -> list:
+    changes = []
+    text.on_change(changes.append)
+    return changes
+
+
+def test_edits_are_forwarded_and_applied_on_read():
+    text = TextValue('hello')
+    changes = recorded(text)
+
+    text.apply_change(5, 0, ' world')
+    text.apply_change(0, 1, 'H')
+
+    assert changes == [TextChange(5, 0, ' world'), TextChange(0, 1, 'H')]
+    assert text.data == 'Hello world'
+
+
+def test_batch_forwards_the_edits_on_commit_without_a_full_copy():
+    text = TextValue('ab')
+    changes = recorded(text)
+
+    with Value.batch():
+        text.apply_change(2, 0, 'c')
+        text.apply_change(0, 0, '_')
+        assert changes == []
+
+    assert changes == [TextChange(2, 0, 'c'), TextChange(0, 0, '_')]
+    assert text.data == '_abc'
+
+
+def test_rolled_back_batch_drops_its_edits():
+    text = TextValue('ab')
+    changes = recorded(text)
+
+    with Value.batch():
+        text.apply_change(2, 0, 'c')
+        with pytest.raises(RuntimeError):
+            with Value.batch():
+                text.apply_change(0, 0, 'x')
+                raise RuntimeError
+        assert text.data == 'abc'
+
+    assert changes == [TextChange(2, 0, 'c')]
+    assert text.data == 'abc'
+
+
+def test_set_data_in_a_batch_is_forwarded_as_a_replacement_in_order():
+    text = TextValue('ab')
+    changes = recorded(text)
+
+    with Value.batch():
+        text.set_data('xyz')
+        text.apply_change(3, 0, '!')
+
+    assert changes == [TextChange(0, 2, 'xyz'), TextChange(3, 0, '!')]
+    assert text.data == 'xyz!'
+
+
+def type_text(widget: MultiLineInput, text: str, position: int = 0):
+    cursor = QTextCursor(widget.document())
+    cursor.setPosition(position)
+    cursor.insertText(text)
+
+
+def test_incremental_input_forwards_typed_text(app):
+    text = TextValue('abc')
+    changes = recorded(text)
+    widget = MultiLineInput(None, text, incremental=True)
+
+    type_text(widget, 'Q')
+    type_text(widget, '!', 4)
+
+    assert changes == [TextChange(0, 0, 'Q'), TextChange(4, 0, '!')]
+    assert text.data == 'Qabc!'
+
+
+def test_text_outlives_the_incremental_input(app):
+    text = TextValue('a')
+    widget = MultiLineInput(None, text, incremental=True)
+    type_text(widget, 'Q')
+
+    sip.delete(widget)
+
+    assert text.data == 'Qa'
+    text.apply_change(2, 0, '!')
+    assert text.data == 'Qa!'
+    # Once detached, the text can be bound again
+    other = MultiLineInput(None, text, incremental=True)
+    assert other.toPlainText() == 'Qa!'
+
+
+def test_text_cannot_be_bound_to_two_incremental_inputs(app):
+    text = TextValue('a')
+    widget = MultiLineInput(None, text, incremental=True)
+
+    with pytest.raises(ValueError):
+        MultiLineInput(None, text, incremental=True)
+    type_text(widget, 'Q')
+    assert text.data == 'Qa'
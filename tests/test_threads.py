@@ -0,0 +1,127 @@
+import threading
+import time
+
+from pyquantum.collection import ValueList, ValueDict
+from pyquantum.ui import ViewModel
+from pyquantum.value import Value, Observer
+
+
+def run_in_thread(function, name: str = 'worker') -> threading.Thread:
+    thread = threading.Thread(target=function, name=name)
+    thread.start()
+    return thread
+
+
+def test_worker_writes_are_applied_on_the_gui_thread(app, dispatcher):
+    value = Value(0)
+    threads = []
+    observer = Observer([value])
+    observer.on_update(lambda data: threads.append((data, threading.current_thread().name)))
+
+    run_in_thread(lambda: [value.set_data(i) for i in range(1, 101)]).join()
+    assert value.data == 0
+    app.processEvents()
+
+    # Writes are coalesced to the latest data per Value and applied by the event loop
+    assert value.data == 100
+    assert threads == [(100, 'MainThread')]
+
+
+def test_worker_batch_does_not_capture_gui_writes(app, dispatcher):
+    model = ViewModel()
+    model.a = 0
+    model.b = 0
+    threads = []
+    observer = Observer([model.a, model.b])
+    observer.on_update(lambda data: threads.append(threading.current_thread().name))
+    inside, release = threading.Event(), threading.Event()
+
+    def worker():
+        with model.transaction():
+            model.b = 5
+            inside.set()
+            release.wait()
+
+    thread = run_in_thread(worker)
+    inside.wait()
+    model.a = 1
+    assert threads == ['MainThread']
+
+    release.set()
+    thread.join()
+    app.processEvents()
+    assert model.b.data == 5
+    assert threads == ['MainThread', 'MainThread']
+
+
+def test_async_results_are_delivered_on_the_gui_thread_without_a_widget(app, monkeypatch):
+    import pyquantum.value
+    monkeypatch.setattr(pyquantum.value, '_dispatcher', None)
+    release = threading.Event()
+    source = Value(1)
+    out = source.map_async(lambda x: release.wait() and x * 10)
+    threads = []
+    observer = Observer([out])
+    observer.on_update(lambda data: threads.append((data, threading.current_thread().name)))
+
+    release.set()
+    deadline = time.monotonic() + 1
+    while not threads and time.monotonic() < deadline:
+        app.processEvents()
+
+    assert threads == [(10, 'MainThread')]
+    assert out.pending.data is False
+
+
+def test_worker_list_and_dict_mutations_are_applied_on_the_gui_thread(app, dispatcher):
+    items, settings = ValueList([1, 2, 3]), ValueDict(a=1)
+    threads = []
+    items.on_change(lambda change: threads.append((change.kind, threading.current_thread().name)))
+    settings.on_change(lambda change: threads.append((change.kind, threading.current_thread().name)))
+
+    popped = []
+
+    def worker():
+        items.append(4)
+        popped.append(items.pop(0))
+        settings['b'] = 2
+
+    run_in_thread(worker).join()
+    assert popped == [1]
+    assert list(items) == [1, 2, 3] and 'b' not in settings
+    app.processEvents()
+
+    assert list(items) == [2, 3, 4] and settings['b'] == 2
+    assert threads == [('insert', 'MainThread'), ('remove', 'MainThread'), ('set', 'MainThread')]
+
+
+def test_async_value_refuses_to_install_the_dispatcher_off_the_gui_thread(app, monkeypatch):
+    import pyquantum.value
+    monkeypatch.setattr(pyquantum.value, '_dispatcher', None)
+    errors = []
+
+    def worker():
+        try:
+            Value(1).map_async(lambda x: x)
+        except RuntimeError as error:
+            errors.append(error)
+
+    run_in_thread(worker).join()
+
+    assert len(errors) == 1
+    assert pyquantum.value._dispatcher is None
+
+
+def test_async_value_created_on_a_worker_delivers_on_the_gui_thread(app, dispatcher):
+    threads = []
+    created = []
+    run_in_thread(lambda: created.append(Value(1).map_async(lambda x: x * 10))).join()
+    out = created[0]
+    observer = Observer([out])
+    observer.on_update(lambda data: threads.append((data, threading.current_thread().name)))
+
+    deadline = time.monotonic() + 1
+    while not threads and time.monotonic() < deadline:
+        app.processEvents()
+
+    assert threads == [(10, 'MainThread')]
@@ -0,0 +1,156 @@
+import gc
+
+import pytest
+from PyQt6 import sip
+from PyQt6.QtWidgets import QLabel
+
+from pyquantum.collection import ValueList
+from pyquantum.ui import Column, ForEach, Label, ListView, TabView
+from pyquantum.value import Value
+
+
+def label(item) -> QLabel:
+    return QLabel(str(item.data))
+
+
+def test_deleted_owner_unregisters_its_change_callback(app):
+    source = ValueList([1, 2, 3])
+    layout = ForEach(source, label)
+    assert len(source._change_callbacks) == 1
+
+    sip.delete(layout)
+
+    assert source._change_callbacks == []
+    source.append(4)
+
+
+def test_collected_owner_is_pruned_on_the_next_change(app):
+    source = ValueList([1, 2, 3])
+    layouts = [ForEach(source, label) for _ in range(3)]
+    del layouts
+    gc.collect()
+    source.append(4)
+
+    assert source._change_callbacks == []
+
+
+def labels(layout: ForEach) -> list:
+    return [layout.itemAt(i).widget().text() for i in range(layout.count()) if layout.itemAt(i).widget()]
+
+
+def test_hidden_tab_receives_no_updates_and_catches_up_when_shown(app):
+    text, items = Value('a'), Value([1, 2])
+    built = {}
+
+    def second():
+        built['label'] = Label(None, text)
+        built['items'] = ForEach(items, label)
+        return Column([built['label'], built['items']])
+
+    tabs = TabView(None, {'first': QLabel('first'), 'second': second}, suspend_hidden=True)
+    tabs.setCurrentIndex(1)
+    app.processEvents()
+    assert built['label'].text() == 'a' and labels(built['items']) == ['1', '2']
+
+    # Queued while shown, but not yet flushed when the tab is hidden
+    text.set_data('b')
+    tabs.setCurrentIndex(0)
+    items.set_data([3])
+    app.processEvents()
+    assert built['label'].text() == 'a' and labels(built['items']) == ['1', '2']
+
+    tabs.setCurrentIndex(1)
+    app.processEvents()
+    assert built['label'].text() == 'b' and labels(built['items']) == ['3']
+
+
+def text_label(item: Value) -> Label:
+    return Label(None, item.map(str), coalesce=False)
+
+
+def visible_rows(view: ListView) -> list:
+    rows = [widget for widget in view.viewport().findChildren(Label) if widget.isVisible()]
+    return [widget.text() for widget in sorted(rows, key=lambda widget: widget.y())]
+
+
+def list_view(app, source, built: list) -> ListView:
+    view = ListView(None, source, lambda item: built.append(item) or text_label(item), row_height=20)
+    view.resize(200, 100)
+    view.show()
+    app.processEvents()
+    return view
+
+
+def test_list_view_builds_rows_for_the_viewport_only(app):
+    built = []
+    view = list_view(app, list(range(10_000)), built)
+
+    assert view.row_count == len(built) <= view.viewport().height() // 20 + 2
+    assert visible_rows(view)[:3] == ['0', '1', '2']
+
+
+def test_list_view_recycles_rows_while_scrolling(app):
+    built = []
+    view = list_view(app, list(range(10_000)), built)
+    widgets = set(view.viewport().findChildren(Label))
+
+    view.scroll_to(5000)
+    app.processEvents()
+
+    assert visible_rows(view)[:2] == ['5000', '5001']
+    assert set(view.viewport().findChildren(Label)) == widgets
+    assert len(built) == view.row_count
+
+
+def test_list_view_rebinds_rows_on_insert_and_reset(app):
+    built = []
+    source = ValueList(range(100))
+    view = list_view(app, source, built)
+    rows = view.row_count
+
+    source.insert(0, 'new')
+    assert visible_rows(view)[:2] == ['new', '0']
+    source.set_data(['a', 'b'])
+    assert visible_rows(view) == ['a', 'b']
+    source.set_data(range(50, 150))
+    assert visible_rows(view)[:2] == ['50', '51']
+    assert view.row_count == rows == len(built)
+
+
+def for_each_widgets(layout: ForEach) -> list:
+    return [layout.itemAt(i).widget() for i in range(layout.count())]
+
+
+def test_for_each_reorder_keeps_widgets_and_moves_the_fewest(app, monkeypatch):
+    items = ValueList([1, 2, 3, 4, 5])
+    layout = ForEach(items, label)
+    widgets = {key: layout.widget_for(key) for key in items}
+    inserted = []
+    insert_widget = layout.insertWidget
+    monkeypatch.setattr(layout, 'insertWidget', lambda *args: inserted.append(args[1]) or insert_widget(*args))
+
+    items.set_data([2, 3, 4, 5, 1])
+
+    assert for_each_widgets(layout) == [widgets[key] for key in [2, 3, 4, 5, 1]]
+    assert inserted == [widgets[1]]
+
+
+def test_for_each_reuses_widgets_by_key(app):
+    built = []
+    items = ValueList([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}])
+
+    def template(item: Value) -> Label:
+        built.append(item)
+        return Label(None, item.map(lambda data: data['name']), coalesce=False)
+
+    layout = ForEach(items, template, key=lambda item: item['id'])
+    first = layout.widget_for(1)
+
+    items.set_data([{'id': 3, 'name': 'c'}, {'id': 1, 'name': 'A'}])
+
+    assert len(built) == 3
+    assert layout.widget_for(1) is first and first.text() == 'A'
+    assert layout.widget_for(2) is None
+    assert [widget.text() for widget in for_each_widgets(layout)] == ['c', 'A']
+    with pytest.raises(ValueError):
+        items.set_data([{'id': 1, 'name': 'x'}, {'id': 1, 'name': 'y'}])